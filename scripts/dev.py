@@ -1,18 +1,23 @@
 """Development script for running the application.
 
-Automatically builds the frontend, then runs the Python main entry point.
+Builds the frontend in the background while the app modules import, then runs the Python main entry point.
 """
 
 import sys
-
-from radio_telemetry_tracker_drone_gcs.main import main as app_main
+from concurrent.futures import ThreadPoolExecutor
 
 from .utils import build_frontend
 
 
 def main() -> int:
     """Build frontend and run the app in development mode."""
-    build_frontend()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        build = executor.submit(build_frontend)
+
+        # Overlap the (Qt, pyproj, numpy) import cost with the npm build
+        from radio_telemetry_tracker_drone_gcs.main import main as app_main  # noqa: PLC0415
+
+        build.result()
     return app_main()
 
 
@@ -1,6 +1,9 @@
 """Shared utility functions for build and development scripts."""
 
+import asyncio
+import hashlib
 import logging
+import os
 import platform
 import shutil
 import subprocess
@@ -11,10 +14,26 @@ logger = logging.getLogger(__name__)
 
 NPM_CMD = "npm.cmd" if platform.system() == "Windows" else "npm"
 
-ALLOWED_COMMANDS = {
-    NPM_CMD: ["install", "run", "build"],
+# Resolve npm once so each spawn runs a fixed absolute path instead of searching PATH
+NPM_PATH = shutil.which(NPM_CMD)
+if NPM_PATH is None:
+    msg = f"{NPM_CMD} was not found on PATH; install Node.js to build the frontend."
+    raise FileNotFoundError(msg)
+
+ALLOWED_COMMANDS: dict[str, frozenset[str]] = {
+    NPM_PATH: frozenset({"install", "run", "build"}),
 }
 
+# Frontend sources and the package directory the built frontend is copied into
+FRONTEND_DIR = Path(__file__).parent.parent / "frontend"
+PACKAGE_DIST = Path(__file__).parent.parent / "radio_telemetry_tracker_drone_gcs" / "frontend_dist"
+
+# Written into the package dist to record which frontend sources it was built from
+BUILD_HASH_FILE = ".build-hash"
+
+# Written into node_modules to record which package manifests it was installed from
+INSTALL_STAMP_FILE = ".install-stamp"
+
 
 def validate_command(cmd: list[str]) -> bool:
     """Ensure the command is in the allowed list for security reasons."""
@@ -24,63 +43,171 @@ def validate_command(cmd: list[str]) -> bool:
     return program in ALLOWED_COMMANDS and all(arg in ALLOWED_COMMANDS[program] for arg in cmd[1:])
 
 
-def _install_frontend_dependencies(frontend_dir: Path) -> None:
-    """Install frontend dependencies using npm."""
-    install_cmd = [NPM_CMD, "install"]
+# Longest single output line accepted from npm; asyncio's default is 64 KiB
+STREAM_LINE_LIMIT = 1024 * 1024
+
+
+async def _run_streaming(cmd: list[str], cwd: Path) -> None:
+    """Run a command, forwarding its combined stdout/stderr to the log as it is produced."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=STREAM_LINE_LIMIT,
+    )
+    async for line in proc.stdout:
+        logger.info("%s", line.decode(errors="replace").rstrip())
+    returncode = await proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def _dependency_hash(frontend_dir: Path) -> str:
+    """Hash package.json and package-lock.json, the inputs that decide what npm install produces."""
+    digest = hashlib.sha256()
+    for name in ("package.json", "package-lock.json"):
+        path = frontend_dir / name
+        if path.is_file():
+            digest.update(name.encode())
+            digest.update(b"\0")
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+async def _install_frontend_dependencies(frontend_dir: Path) -> None:
+    """Install frontend dependencies using npm, unless node_modules is already current."""
+    stamp = frontend_dir / "node_modules" / INSTALL_STAMP_FILE
+    if stamp.is_file() and stamp.read_text(encoding="utf-8") == _dependency_hash(frontend_dir):
+        logger.info("Frontend dependencies up to date, skipping npm install")
+        return
+
+    install_cmd = [NPM_PATH, "install"]
     if not validate_command(install_cmd):
         msg = "Invalid or disallowed command for installing frontend dependencies."
         raise ValueError(msg)
 
     logger.info("Installing frontend dependencies...")
-    result = subprocess.run(install_cmd, cwd=frontend_dir, check=True, capture_output=True, text=True)  # noqa: S603
-    if result.stdout:
-        logger.info("npm install output:\n%s", result.stdout)
-    if result.stderr:
-        logger.warning("npm install warnings/errors:\n%s", result.stderr)
+    await _run_streaming(install_cmd, frontend_dir)
+
+    # Hash after installing, since npm install may have written package-lock.json; a package with
+    # no dependencies leaves no node_modules behind
+    stamp.parent.mkdir(exist_ok=True)
+    stamp.write_text(_dependency_hash(frontend_dir), encoding="utf-8")
 
 
-def _build_frontend_dist(frontend_dir: Path) -> None:
+async def _build_frontend_dist(frontend_dir: Path) -> None:
     """Build the frontend using npm."""
-    build_cmd = [NPM_CMD, "run", "build"]
+    build_cmd = [NPM_PATH, "run", "build"]
     if not validate_command(build_cmd):
         msg = "Invalid or disallowed command for building frontend."
         raise ValueError(msg)
 
     logger.info("Building frontend...")
-    result = subprocess.run(build_cmd, cwd=frontend_dir, check=True, capture_output=True, text=True)  # noqa: S603
-    if result.stdout:
-        logger.info("npm build output:\n%s", result.stdout)
-    if result.stderr:
-        logger.warning("npm build warnings/errors:\n%s", result.stderr)
+    await _run_streaming(build_cmd, frontend_dir)
+
+
+def _scan_files(root: Path) -> dict[str, os.stat_result]:
+    """Walk root once with os.scandir, mapping each file's relative POSIX path to its stat result."""
+    files: dict[str, os.stat_result] = {}
+    pending = [(root, "")]
+    while pending:
+        directory, prefix = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append((Path(entry.path), f"{prefix}{entry.name}/"))
+                elif entry.is_file():
+                    files[f"{prefix}{entry.name}"] = entry.stat()
+    return files
+
+
+def _dist_manifest(files: dict[str, os.stat_result]) -> set[tuple[str, int, int]]:
+    """Return (relative path, size, mtime) for each scanned file, ignoring the build stamp."""
+    return {(name, stat.st_size, stat.st_mtime_ns) for name, stat in files.items() if name != BUILD_HASH_FILE}
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hard-link src to dst, falling back to a full copy across filesystems or where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        return shutil.copy2(src, dst)
+    return dst
 
 
 def _copy_frontend_to_package(frontend_dir: Path, package_dist: Path) -> Path:
     """Copy built frontend to package directory."""
+    # One scan of the build output both validates it and drives the copy
     dist_dir = frontend_dir / "dist"
-    if not dist_dir.exists() or not any(dist_dir.iterdir()):
+    dist_files = _scan_files(dist_dir) if dist_dir.is_dir() else {}
+    if not dist_files:
         msg = "Frontend build did not produce any output files"
         raise RuntimeError(msg)
 
-    # Copy to package directory
+    # Hard links and copy2 both keep size and mtime, so a matching manifest means nothing changed
     if package_dist.exists():
+        if _dist_manifest(_scan_files(package_dist)) == _dist_manifest(dist_files):
+            logger.info("Frontend build already in package at: %s", package_dist)
+            return package_dist
         shutil.rmtree(package_dist)
-    shutil.copytree(dist_dir, package_dist)
+
+    # Copy to package directory
+    for parent in {(package_dist / name).parent for name in dist_files}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for name in dist_files:
+        _link_or_copy(str(dist_dir / name), str(package_dist / name))
 
     logger.info("Frontend build copied to package at: %s", package_dist)
     return package_dist
 
 
+def _frontend_source_hash(frontend_dir: Path) -> str:
+    """Hash the inputs that determine the build output: top-level config files and everything under src/."""
+    sources = [path for path in frontend_dir.iterdir() if path.is_file()]
+    sources += [path for path in (frontend_dir / "src").rglob("*") if path.is_file()]
+
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        digest.update(path.relative_to(frontend_dir).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _hash_matches(package_dist: Path, source_hash: str) -> bool:
+    """Check whether the package dist was built from sources with the given hash."""
+    stamp = package_dist / BUILD_HASH_FILE
+    return stamp.is_file() and stamp.read_text(encoding="utf-8") == source_hash
+
+
+async def _install_and_build(frontend_dir: Path) -> None:
+    """Run npm install and npm run build for one frontend; independent frontends can be gathered."""
+    await _install_frontend_dependencies(frontend_dir)
+    await _build_frontend_dist(frontend_dir)
+
+
 def build_frontend() -> Path:
     """Build the frontend using npm and copy to package directory.
 
     Returns:
         Path: The path to the copied frontend dist directory
     """
-    frontend_dir = Path(__file__).parent.parent / "frontend"
-    package_dist = Path(__file__).parent.parent / "radio_telemetry_tracker_drone_gcs" / "frontend_dist"
+    frontend_dir = FRONTEND_DIR
+    package_dist = PACKAGE_DIST
+
+    source_hash = _frontend_source_hash(frontend_dir)
+    if package_dist.exists() and _hash_matches(package_dist, source_hash):
+        logger.info("Frontend sources unchanged, reusing build at: %s", package_dist)
+        return package_dist
 
     logger.info("Building frontend in %s...", frontend_dir)
 
-    _install_frontend_dependencies(frontend_dir)
-    _build_frontend_dist(frontend_dir)
-    return _copy_frontend_to_package(frontend_dir, package_dist)
+    asyncio.run(_install_and_build(frontend_dir))
+    _copy_frontend_to_package(frontend_dir, package_dist)
+
+    # Re-hash after the build: npm install may have created or updated package-lock.json
+    (package_dist / BUILD_HASH_FILE).write_text(_frontend_source_hash(frontend_dir), encoding="utf-8")
+    return package_dist
@@ -5,14 +5,19 @@ Provides a Qt-based interface for drone operations, tile management, and POI han
 
 from __future__ import annotations
 
-import base64
+import binascii
 import logging
 import time
-from typing import Any
-
-import pyproj
-import serial.tools.list_ports
-from PyQt6.QtCore import QObject, QTimer, QVariant, pyqtSignal, pyqtSlot
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from pyproj import Transformer
+from PyQt6.QtCore import QObject, Qt, QTimer, QVariant, pyqtBoundSignal, pyqtSignal, pyqtSlot
 from radio_telemetry_tracker_drone_comms_package import (
     ConfigRequestData,
     ConfigResponseData,
@@ -25,6 +30,7 @@ from radio_telemetry_tracker_drone_comms_package import (
     StopResponseData,
     SyncResponseData,
 )
+from serial.tools import list_ports
 
 from radio_telemetry_tracker_drone_gcs.comms.drone_comms_service import DroneCommsService
 from radio_telemetry_tracker_drone_gcs.comms.state_machine import DroneState, DroneStateMachine, StateTransition
@@ -43,8 +49,83 @@ from radio_telemetry_tracker_drone_gcs.services.poi_service import PoiService
 from radio_telemetry_tracker_drone_gcs.services.simulator_service import SimulatorService
 from radio_telemetry_tracker_drone_gcs.services.tile_service import TileService
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:  # Optional GPU path for very large batches (RAPIDS cuProj)
+    import cuproj
+    import cupy as cp
+except Exception:  # noqa: BLE001 - a broken CUDA setup can fail at import with more than ImportError
+    cp = None
+    cuproj = None
+
 logger = logging.getLogger(__name__)
 
+WGS84_EPSG = 4326
+
+# Below this many points host <-> device copies cost more than the GPU saves
+GPU_TRANSFORM_MIN_POINTS = 100_000
+
+# Window for coalescing packet bursts into one frontend update (~30 Hz)
+FLUSH_INTERVAL_MS = 33
+
+# Frontend config keys, extracted in one pass per request
+_RADIO_KEYS = itemgetter("interface_type", "port", "baudrate", "host", "tcp_port")
+_ACK_KEYS = itemgetter("ack_timeout", "max_retries")
+_CONFIG_KEYS = itemgetter(
+    "gain",
+    "sampling_rate",
+    "center_frequency",
+    "enable_test_data",
+    "ping_width_ms",
+    "ping_min_snr",
+    "ping_max_len_mult",
+    "ping_min_len_mult",
+    "target_frequencies",
+)
+
+# How long a serial port scan is reused before the OS is queried again
+SERIAL_PORTS_CACHE_TTL_S = 1.0
+
+
+@lru_cache(maxsize=64)
+def _get_transformer(epsg_code: int) -> Transformer:
+    """Return a cached UTM -> WGS84 transformer for the given EPSG code.
+
+    Building a Transformer hits the PROJ database and costs milliseconds, while a
+    single transform is microseconds, so one instance is kept per EPSG code.
+    """
+    return Transformer.from_crs(epsg_code, WGS84_EPSG, always_xy=True)
+
+
+@lru_cache(maxsize=64)
+def _get_gpu_transformer(epsg_code: int) -> cuproj.Transformer:
+    """Return a cached cuProj UTM -> WGS84 transformer for the given EPSG code."""
+    return cuproj.Transformer.from_crs(f"EPSG:{epsg_code}", f"EPSG:{WGS84_EPSG}")
+
+
+def _log_invalid_packet(packet: object, exc: AttributeError) -> None:
+    """Log a packet that is dropped from its batch because a field is missing."""
+    logger.warning("Dropping invalid %s: missing required attribute '%s'", type(packet).__name__, exc.name)
+
+
+@dataclass(frozen=True, slots=True)
+class _RequestOp:
+    """Wiring for one request kind: its DroneCommsService methods and the bridge's handler and failure signal."""
+
+    register: str
+    unregister: str
+    send: str
+    on_response: Callable[[Any], None]
+    failure: pyqtBoundSignal
+
+    def __post_init__(self) -> None:
+        """Reject comms method names DroneCommsService does not define, so a typo fails on construction."""
+        for name in (self.register, self.unregister, self.send):
+            if not hasattr(DroneCommsService, name):
+                msg = f"DroneCommsService has no method {name!r}"
+                raise AttributeError(msg)
+
 
 class CommunicationBridge(QObject):
     """Bridge between Qt frontend and drone communications backend, handling all drone-related operations."""
@@ -88,18 +169,24 @@ class CommunicationBridge(QObject):
     simulator_started = pyqtSignal()
     simulator_stopped = pyqtSignal()
 
+    # Internal: arms the flush timer on the GUI thread
+    _flush_requested = pyqtSignal()
 
     def __init__(self) -> None:
         """Initialize the communication bridge with data manager and services."""
         super().__init__()
 
+        # Forward signal-to-signal so no Python slot runs per update
         self._drone_data_manager = DroneDataManager()
-        self._drone_data_manager.gps_data_updated.connect(self.gps_data_updated.emit)
-        self._drone_data_manager.frequency_data_updated.connect(self.frequency_data_updated.emit)
+        self._drone_data_manager.gps_data_updated.connect(self.gps_data_updated)
+        self._drone_data_manager.frequency_data_updated.connect(self.frequency_data_updated)
 
         # Tile & POI
         self._tile_service = TileService()
         self._poi_service = PoiService()
+        self._emit_tile_info_signal = self.tile_info_updated.emit
+        self._emit_pois_signal = self.pois_updated.emit
+        self._last_tile_info: dict | None = None
 
         #Tracking Sessions
         self._frequency_service = FrequencyService()
@@ -111,58 +198,95 @@ class CommunicationBridge(QObject):
 
         # Comms
         self._comms_service: DroneCommsService | None = None
-        self._sync_response_received: bool = False
-        self._config_response_received: bool = False
-        self._start_response_received: bool = False
-        self._stop_response_received: bool = False
-        self._disconnect_response_received: bool = False
+
+        # Requests sent through _send_request; handlers and signals are bound here rather than looked up by name
+        self._request_ops: dict[str, _RequestOp] = {
+            "config": _RequestOp(
+                register="register_config_response_handler",
+                unregister="unregister_config_response_handler",
+                send="send_config_request",
+                on_response=self._on_config_response,
+                failure=self.config_failure,
+            ),
+            "start": _RequestOp(
+                register="register_start_response_handler",
+                unregister="unregister_start_response_handler",
+                send="send_start_request",
+                on_response=self._on_start_response,
+                failure=self.start_failure,
+            ),
+            "stop": _RequestOp(
+                register="register_stop_response_handler",
+                unregister="unregister_stop_response_handler",
+                send="send_stop_request",
+                on_response=self._on_stop_response,
+                failure=self.stop_failure,
+            ),
+        }
+        # Signal emitted when each request's response times out; a disconnect timeout forces cleanup instead
+        self._timeout_signals: dict[str, pyqtBoundSignal] = {
+            "sync": self.sync_timeout,
+            "config": self.config_timeout,
+            "start": self.start_timeout,
+            "stop": self.stop_timeout,
+        }
+        self._response_received: dict[str, bool] = dict.fromkeys((*self._timeout_signals, "disconnect"), False)
+
+        # Request timeouts: one reusable timer, since only one request is in flight at a time
+        self._pending_op: str | None = None
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.timeout.connect(self._on_request_timeout)
 
         # Simulator
         self._simulator_service: SimulatorService | None = None
 
+        # Serial port scan cache: (monotonic timestamp, device names)
+        self._ports_cache: tuple[float, list[str]] | None = None
+
+        # Packet batching: handlers run on the comms thread and only buffer (and log); the single
+        # UI-facing step, arming the flush timer, is explicitly queued onto the GUI thread
+        self._pending_lock = Lock()
+        self._pending_gps: list[GPSData] = []
+        self._pending_pings: list[PingData] = []
+        self._pending_loc_ests: list[LocEstData] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_packets)
+        self._flush_requested.connect(self._flush_timer.start, Qt.ConnectionType.QueuedConnection)
+
     def _setup_state_handlers(self) -> None:
         """Set up state machine handlers."""
         # Radio config handlers
-        self._state_machine.register_transition_handler(
-            DroneState.RADIO_CONFIG_WAITING,
-            lambda: self._comms_service.register_sync_response_handler(self._on_sync_response, once=True),
-        )
+        self._state_machine.register_transition_handler(DroneState.RADIO_CONFIG_WAITING, self._reg_sync)
 
         # Ping finder config handlers
-        self._state_machine.register_transition_handler(
-            DroneState.PING_FINDER_CONFIG_WAITING,
-            lambda: self._comms_service.register_config_response_handler(self._on_config_response, once=True),
-        )
+        self._state_machine.register_transition_handler(DroneState.PING_FINDER_CONFIG_WAITING, self._reg_config)
 
         # Start handlers
-        self._state_machine.register_transition_handler(
-            DroneState.START_WAITING,
-            lambda: self._comms_service.register_start_response_handler(self._on_start_response, once=True),
-        )
+        self._state_machine.register_transition_handler(DroneState.START_WAITING, self._reg_start)
 
         # Stop handlers
-        self._state_machine.register_transition_handler(
-            DroneState.STOP_WAITING,
-            lambda: self._comms_service.register_stop_response_handler(self._on_stop_response, once=True),
-        )
+        self._state_machine.register_transition_handler(DroneState.STOP_WAITING, self._reg_stop)
 
         # Register timeout handlers
-        self._state_machine.register_timeout_handler(
-            DroneState.RADIO_CONFIG_WAITING,
-            lambda: self.sync_timeout.emit(),
-        )
-        self._state_machine.register_timeout_handler(
-            DroneState.PING_FINDER_CONFIG_WAITING,
-            lambda: self.config_timeout.emit(),
-        )
-        self._state_machine.register_timeout_handler(
-            DroneState.START_WAITING,
-            lambda: self.start_timeout.emit(),
-        )
-        self._state_machine.register_timeout_handler(
-            DroneState.STOP_WAITING,
-            lambda: self.stop_timeout.emit(),
-        )
+        self._state_machine.register_timeout_handler(DroneState.RADIO_CONFIG_WAITING, self.sync_timeout.emit)
+        self._state_machine.register_timeout_handler(DroneState.PING_FINDER_CONFIG_WAITING, self.config_timeout.emit)
+        self._state_machine.register_timeout_handler(DroneState.START_WAITING, self.start_timeout.emit)
+        self._state_machine.register_timeout_handler(DroneState.STOP_WAITING, self.stop_timeout.emit)
+
+    def _reg_sync(self) -> None:
+        self._comms_service.register_sync_response_handler(self._on_sync_response, once=True)
+
+    def _reg_config(self) -> None:
+        self._comms_service.register_config_response_handler(self._on_config_response, once=True)
+
+    def _reg_start(self) -> None:
+        self._comms_service.register_start_response_handler(self._on_start_response, once=True)
+
+    def _reg_stop(self) -> None:
+        self._comms_service.register_stop_response_handler(self._on_stop_response, once=True)
 
     # --------------------------------------------------------------------------
     # Basic slots for comms
@@ -171,8 +295,13 @@ class CommunicationBridge(QObject):
     @pyqtSlot(result="QVariantList")
     def get_serial_ports(self) -> list[str]:
         """Return a list of available serial port device names."""
-        port_info = list(serial.tools.list_ports.comports())
-        return [str(p.device) for p in port_info]
+        now = time.monotonic()
+        if self._ports_cache is not None and now - self._ports_cache[0] < SERIAL_PORTS_CACHE_TTL_S:
+            return list(self._ports_cache[1])
+
+        ports = [str(p.device) for p in list_ports.comports()]
+        self._ports_cache = (now, ports)
+        return list(ports)
 
     @pyqtSlot("QVariantMap", result=bool)
     def initialize_comms(self, config: dict[str, Any]) -> bool:
@@ -185,16 +314,18 @@ class CommunicationBridge(QObject):
             bool: True if initialization succeeded, False otherwise.
         """
         try:
+            interface_type, port, baudrate, host, tcp_port = _RADIO_KEYS(config)
             radio_cfg = RadioConfig(
-                interface_type=config["interface_type"],
-                port=config["port"],
-                baudrate=int(config["baudrate"]),
-                host=config["host"],
-                tcp_port=int(config["tcp_port"]),
+                interface_type=interface_type,
+                port=port,
+                baudrate=int(baudrate),
+                host=host,
+                tcp_port=int(tcp_port),
                 server_mode=False,
             )
-            ack_s = float(config["ack_timeout"])
-            max_r = int(config["max_retries"])
+            ack_timeout, max_retries = _ACK_KEYS(config)
+            ack_s = float(ack_timeout)
+            max_r = int(max_retries)
 
             self._comms_service = DroneCommsService(
                 radio_config=radio_cfg,
@@ -219,12 +350,10 @@ class CommunicationBridge(QObject):
                 ),
             )
 
-            # Send sync
+            # Send sync (the response handler is registered by the RADIO_CONFIG_WAITING transition)
+            self._response_received["sync"] = False
             self._comms_service.send_sync_request()
-            self._sync_response_received = False
-
-            tt = ack_s * max_r
-            QTimer.singleShot(int(tt * 1000), self._sync_timeout_check)
+            self._start_request_timeout("sync", self._comms_service.timeout_ms)
         except Exception as e:
             logger.exception("Error in initialize_comms")
             self.sync_failure.emit(f"Initialize comms failed: {e!s}")
@@ -248,16 +377,45 @@ class CommunicationBridge(QObject):
             return
         try:
             self._comms_service.register_stop_response_handler(self._on_disconnect_response, once=True)
+            self._response_received["disconnect"] = False
             self._comms_service.send_stop_request()
-            self._disconnect_response_received = False
-
-            tt = self._comms_service.ack_timeout * self._comms_service.max_retries
-            QTimer.singleShot(int(tt * 1000), self._disconnect_timeout_check)
+            self._start_request_timeout("disconnect", self._comms_service.timeout_ms)
         except Exception:
             logger.exception("Stop request failed => forcing cleanup.")
             self.disconnect_failure.emit("Stop request failed... forcing cleanup.")
             self._cleanup()
 
+    # --------------------------------------------------------------------------
+    # Requests (shared by config, start and stop)
+    # --------------------------------------------------------------------------
+    def _send_request(self, op: str, *args: object) -> bool:
+        """Register the response handler, send the request and arm its timeout."""
+        spec = self._request_ops[op]
+        if not self._comms_service:
+            spec.failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
+            return False
+
+        try:
+            getattr(self._comms_service, spec.register)(spec.on_response, once=True)
+            self._response_received[op] = False
+            getattr(self._comms_service, spec.send)(*args)
+            self._start_request_timeout(op, self._comms_service.timeout_ms)
+        except Exception as e:
+            logger.exception("Error in send_%s_request", op)
+            spec.failure.emit(str(e))
+            return False
+        else:
+            return True
+
+    def _cancel_request(self, op: str) -> bool:
+        """Stop listening for the response to a pending request."""
+        spec = self._request_ops[op]
+        if not self._comms_service:
+            spec.failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
+            return False
+        getattr(self._comms_service, spec.unregister)(spec.on_response)
+        return True
+
     # --------------------------------------------------------------------------
     # Config
     # --------------------------------------------------------------------------
@@ -269,39 +427,29 @@ class CommunicationBridge(QObject):
             return False
 
         try:
+            gain, sr, cf, etd, pwm, pms, pmax, pmin, tfs = _CONFIG_KEYS(cfg)
             req = ConfigRequestData(
-                gain=float(cfg["gain"]),
-                sampling_rate=int(cfg["sampling_rate"]),
-                center_frequency=int(cfg["center_frequency"]),
+                gain=float(gain),
+                sampling_rate=int(sr),
+                center_frequency=int(cf),
                 run_num=int(time.time()),
-                enable_test_data=bool(cfg["enable_test_data"]),
-                ping_width_ms=int(cfg["ping_width_ms"]),
-                ping_min_snr=int(cfg["ping_min_snr"]),
-                ping_max_len_mult=float(cfg["ping_max_len_mult"]),
-                ping_min_len_mult=float(cfg["ping_min_len_mult"]),
-                target_frequencies=list(map(int, cfg["target_frequencies"])),
+                enable_test_data=bool(etd),
+                ping_width_ms=int(pwm),
+                ping_min_snr=int(pms),
+                ping_max_len_mult=float(pmax),
+                ping_min_len_mult=float(pmin),
+                target_frequencies=list(map(int, tfs)),
             )
-            self._comms_service.register_config_response_handler(self._on_config_response, once=True)
-            self._comms_service.send_config_request(req)
-            self._config_response_received = False
-
-            tt = self._comms_service.ack_timeout * self._comms_service.max_retries
-            QTimer.singleShot(int(tt * 1000), self._config_timeout_check)
         except Exception as e:
             logger.exception("Error in send_config_request")
             self.config_failure.emit(str(e))
             return False
-        else:
-            return True
+        return self._send_request("config", req)
 
     @pyqtSlot(result=bool)
     def cancel_config_request(self) -> bool:
         """Cancel the config request."""
-        if not self._comms_service:
-            self.config_failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
-            return False
-        self._comms_service.unregister_config_response_handler(self._on_config_response)
-        return True
+        return self._cancel_request("config")
 
     # --------------------------------------------------------------------------
     # Start
@@ -309,32 +457,12 @@ class CommunicationBridge(QObject):
     @pyqtSlot(result=bool)
     def send_start_request(self) -> bool:
         """Send start request => wait => user can cancel => if ack fails => start_timeout."""
-        if not self._comms_service:
-            self.start_failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
-            return False
-
-        try:
-            self._comms_service.register_start_response_handler(self._on_start_response, once=True)
-            self._comms_service.send_start_request()
-            self._start_response_received = False
-
-            tt = self._comms_service.ack_timeout * self._comms_service.max_retries
-            QTimer.singleShot(int(tt * 1000), self._start_timeout_check)
-        except Exception as e:
-            logger.exception("Error in send_start_request")
-            self.start_failure.emit(str(e))
-            return False
-        else:
-            return True
+        return self._send_request("start")
 
     @pyqtSlot(result=bool)
     def cancel_start_request(self) -> bool:
         """Cancel the start request."""
-        if not self._comms_service:
-            self.start_failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
-            return False
-        self._comms_service.unregister_start_response_handler(self._on_start_response)
-        return True
+        return self._cancel_request("start")
 
     # --------------------------------------------------------------------------
     # Stop
@@ -342,37 +470,69 @@ class CommunicationBridge(QObject):
     @pyqtSlot(result=bool)
     def send_stop_request(self) -> bool:
         """Send stop request => wait => user can cancel => if ack fails => stop_timeout."""
-        if not self._comms_service:
-            self.stop_failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
-            return False
-
-        try:
-            self._comms_service.register_stop_response_handler(self._on_stop_response, once=True)
-            self._comms_service.send_stop_request()
-            self._stop_response_received = False
-
-            tt = self._comms_service.ack_timeout * self._comms_service.max_retries
-            QTimer.singleShot(int(tt * 1000), self._stop_timeout_check)
-        except Exception as e:
-            logger.exception("Error in send_stop_request")
-            self.stop_failure.emit(str(e))
-            return False
-        else:
-            return True
+        return self._send_request("stop")
 
     @pyqtSlot(result=bool)
     def cancel_stop_request(self) -> bool:
         """Cancel the stop request."""
-        if not self._comms_service:
-            self.stop_failure.emit("UNDEFINED BEHAVIOR: Not Connected.")
-            return False
-        self._comms_service.unregister_stop_response_handler(self._on_stop_response)
-        return True
+        return self._cancel_request("stop")
 
     # --------------------------------------------------------------------------
     # GPS, Ping, LocEst
     # --------------------------------------------------------------------------
     def _handle_gps_data(self, gps: GPSData) -> None:
+        """Buffer GPS data from drone and arm the flush timer if this starts a new batch."""
+        self._queue_packet(self._pending_gps, gps)
+
+    def _handle_ping_data(self, ping: PingData) -> None:
+        """Buffer ping data from drone and arm the flush timer if this starts a new batch."""
+        self._queue_packet(self._pending_pings, ping)
+
+    def _handle_loc_est_data(self, loc_est: LocEstData) -> None:
+        """Buffer location estimate data from drone and arm the flush timer if this starts a new batch."""
+        self._queue_packet(self._pending_loc_ests, loc_est)
+
+    def _queue_packet(self, pending: list[Any], packet: object) -> None:
+        with self._pending_lock:
+            first_in_batch = not (self._pending_pings or self._pending_gps or self._pending_loc_ests)
+            pending.append(packet)
+        if first_in_batch:
+            self._flush_requested.emit()
+
+    def _flush_pending_packets(self) -> None:
+        """Hand all buffered packets to the data manager, one update per packet kind."""
+        with self._pending_lock:
+            gps_fixes, self._pending_gps = self._pending_gps, []
+            pings, self._pending_pings = self._pending_pings, []
+            loc_ests, self._pending_loc_ests = self._pending_loc_ests, []
+
+        if gps_fixes:
+            try:
+                self._flush_gps(gps_fixes)
+            except Exception:
+                logger.exception("Error handling GPS data")
+
+        internal_pings: list[InternalPingData] = []
+        if pings:
+            try:
+                internal_pings = self._transform_pings(pings)
+            except Exception:
+                logger.exception("Error handling ping data")
+
+        internal_loc_ests: list[InternalLocEstData] = []
+        if loc_ests:
+            try:
+                internal_loc_ests = self._transform_loc_ests(loc_ests)
+            except Exception:
+                logger.exception("Error handling location estimate data")
+
+        # Pings and estimates share the frequency snapshot, so send it once per flush
+        if internal_pings or internal_loc_ests:
+            self._drone_data_manager.apply_batch(internal_pings, internal_loc_ests)
+
+    def _flush_gps(self, gps_fixes: list[GPSData]) -> None:
+        """Publish only the newest fix; the frontend keeps just the current drone position."""
+        gps = gps_fixes[-1]
         lat, lng = self._transform_coords(gps.easting, gps.northing, gps.epsg_code)
         internal_gps = InternalGpsData(
             lat=lat,
@@ -384,56 +544,107 @@ class CommunicationBridge(QObject):
         )
         self._drone_data_manager.update_gps(internal_gps)
 
-    def _handle_ping_data(self, ping: PingData) -> None:
-        """Handle ping data from drone."""
-        try:
-            # Validate ping data
-            if not all(
-                hasattr(ping, attr)
-                for attr in ["easting", "northing", "epsg_code", "frequency", "amplitude", "timestamp", "packet_id"]
-            ):
-                logger.error("Invalid ping data received: missing required attributes")
-                return
-
-            lat, lng = self._transform_coords(ping.easting, ping.northing, ping.epsg_code)
-            logger.info(
-                "Ping data received - Freq: %d Hz, Amplitude: %.2f dB, UTM: (%.2f, %.2f) -> LatLng: (%.6f, %.6f)",
-                ping.frequency,
-                ping.amplitude,
-                ping.easting,
-                ping.northing,
-                lat,
-                lng,
-            )
-            internal_ping = InternalPingData(
-                frequency=ping.frequency,
-                amplitude=ping.amplitude,
-                lat=lat,
-                long=lng,
-                timestamp=ping.timestamp,
-                packet_id=ping.packet_id,
+    def _transform_loc_ests(self, loc_ests: list[LocEstData]) -> list[InternalLocEstData]:
+        """Convert the newest location estimate per frequency to internal records with lat/lng coordinates."""
+        latest: dict[int, LocEstData] = {}
+        for loc_est in loc_ests:
+            try:
+                latest[loc_est.frequency] = loc_est
+            except AttributeError as exc:
+                _log_invalid_packet(loc_est, exc)
+        kept, lats, lngs = self._transform_packets(list(latest.values()))
+        log_loc_ests = logger.isEnabledFor(logging.DEBUG)
+        internal_loc_ests: list[InternalLocEstData] = []
+        for loc_est, lat, lng in zip(kept, lats, lngs, strict=True):
+            try:
+                internal_loc_est = InternalLocEstData(
+                    frequency=loc_est.frequency,
+                    lat=lat,
+                    long=lng,
+                    timestamp=loc_est.timestamp,
+                    packet_id=loc_est.packet_id,
+                )
+            except AttributeError as exc:
+                _log_invalid_packet(loc_est, exc)
+                continue
+            if log_loc_ests:
+                logger.debug(
+                    "Location estimate received - Freq: %d Hz, Position: (%.6f, %.6f)",
+                    loc_est.frequency,
+                    lat,
+                    lng,
+                )
+            internal_loc_ests.append(internal_loc_est)
+        return internal_loc_ests
+
+    def _transform_pings(self, pings: list[PingData]) -> list[InternalPingData]:
+        """Convert a batch of pings to internal records with lat/lng coordinates."""
+        kept, lats, lngs = self._transform_packets(pings)
+        log_pings = logger.isEnabledFor(logging.DEBUG)
+        internal_pings: list[InternalPingData] = []
+        for ping, lat, lng in zip(kept, lats, lngs, strict=True):
+            try:
+                internal_ping = InternalPingData(
+                    frequency=ping.frequency,
+                    amplitude=ping.amplitude,
+                    lat=lat,
+                    long=lng,
+                    timestamp=ping.timestamp,
+                    packet_id=ping.packet_id,
+                )
+            except AttributeError as exc:
+                _log_invalid_packet(ping, exc)
+                continue
+            if log_pings:
+                logger.debug(
+                    "Ping data received - Freq: %d Hz, Amplitude: %.2f dB, UTM: (%.2f, %.2f) -> LatLng: (%.6f, %.6f)",
+                    ping.frequency,
+                    ping.amplitude,
+                    ping.easting,
+                    ping.northing,
+                    lat,
+                    lng,
+                )
+            internal_pings.append(internal_ping)
+        return internal_pings
+
+    def _transform_packets[PacketT: (PingData, LocEstData)](
+        self,
+        packets: list[PacketT],
+    ) -> tuple[list[PacketT], list[float], list[float]]:
+        """Return (packets, lats, lngs) for a batch of UTM packets, with one PROJ call per EPSG code.
+
+        Packets missing a coordinate field are logged and left out; the returned packets line up
+        with the coordinates and keep their input order.
+        """
+        kept: list[PacketT] = []
+        eastings: list[float] = []
+        northings: list[float] = []
+        by_epsg: dict[int, list[int]] = defaultdict(list)
+        for packet in packets:
+            try:
+                easting, northing, epsg_code = packet.easting, packet.northing, packet.epsg_code
+            except AttributeError as exc:
+                _log_invalid_packet(packet, exc)
+                continue
+            by_epsg[epsg_code].append(len(kept))
+            kept.append(packet)
+            eastings.append(easting)
+            northings.append(northing)
+
+        all_eastings = np.array(eastings, dtype=np.float64)
+        all_northings = np.array(northings, dtype=np.float64)
+        lats = np.empty(len(kept), dtype=np.float64)
+        lngs = np.empty(len(kept), dtype=np.float64)
+        for epsg_code, indices in by_epsg.items():
+            group_lats, group_lngs = self._transform_coords_batch(
+                all_eastings[indices],
+                all_northings[indices],
+                epsg_code,
             )
-            self._drone_data_manager.add_ping(internal_ping)
-        except Exception:
-            logger.exception("Error handling ping data")
-
-    def _handle_loc_est_data(self, loc_est: LocEstData) -> None:
-        """Handle location estimate data from drone."""
-        lat, lng = self._transform_coords(loc_est.easting, loc_est.northing, loc_est.epsg_code)
-        internal_loc_est = InternalLocEstData(
-            frequency=loc_est.frequency,
-            lat=lat,
-            long=lng,
-            timestamp=loc_est.timestamp,
-            packet_id=loc_est.packet_id,
-        )
-        logger.info(
-            "Location estimate received - Freq: %d Hz, Position: (%.6f, %.6f)",
-            loc_est.frequency,
-            lat,
-            lng,
-        )
-        self._drone_data_manager.update_loc_est(internal_loc_est)
+            lats[indices] = group_lats
+            lngs[indices] = group_lngs
+        return kept, lats.tolist(), lngs.tolist()
 
     # --------------------------------------------------------------------------
     # Error
@@ -464,10 +675,12 @@ class CommunicationBridge(QObject):
             tile_data = self._tile_service.get_tile(z, x, y, source_id=source, offline=offline)
             if not tile_data:
                 return ""
-            # We can update tile info
+            # Only notify the frontend when the cache contents actually changed
             info = self._tile_service.get_tile_info()
-            self.tile_info_updated.emit(QVariant(info))
-            return base64.b64encode(tile_data).decode("utf-8")
+            if info != self._last_tile_info:
+                self._last_tile_info = info
+                self._emit_tile_info_signal(info)
+            return binascii.b2a_base64(tile_data, newline=False).decode("ascii")
         except Exception:
             logger.exception("Error in get_tile()")
             return ""
@@ -538,7 +751,7 @@ class CommunicationBridge(QObject):
 
     def _emit_pois(self) -> None:
         pois = self._poi_service.get_pois()
-        self.pois_updated.emit(QVariant(pois))
+        self._emit_pois_signal(pois)
 
     # --------------------------------------------------------------------------
     # Frequency and Tracking Session Bridging
@@ -588,43 +801,34 @@ class CommunicationBridge(QObject):
     # --------------------------------------------------------------------------
     # TIMEOUTS
     # --------------------------------------------------------------------------
-    def _sync_timeout_check(self) -> None:
-        if not self._sync_response_received:
-            logger.warning("Sync response not received => sync_timeout.")
-            self.sync_timeout.emit()
-            self._sync_response_received = True
-
-    def _config_timeout_check(self) -> None:
-        if not self._config_response_received:
-            logger.warning("Config response not received => config_timeout.")
-            self.config_timeout.emit()
-            self._config_response_received = True
-
-    def _start_timeout_check(self) -> None:
-        if not self._start_response_received:
-            logger.warning("Start response not received => start_timeout.")
-            self.start_timeout.emit()
-            self._start_response_received = True
-
-    def _stop_timeout_check(self) -> None:
-        if not self._stop_response_received:
-            logger.warning("Stop response not received => stop_timeout.")
-            self.stop_timeout.emit()
-            self._stop_response_received = True
-
-    def _disconnect_timeout_check(self) -> None:
-        if not self._disconnect_response_received:
-            logger.warning("Stop response not received => forcibly cleanup => disconnect_timeout.")
-            self.disconnect_failure.emit("Stop response not received => forcibly cleanup => disconnect_timeout.")
+    def _start_request_timeout(self, op: str, timeout_ms: int) -> None:
+        """(Re)arm the shared timeout timer for the request that was just sent."""
+        self._pending_op = op
+        self._timeout_timer.start(timeout_ms)
+
+    def _on_request_timeout(self) -> None:
+        op, self._pending_op = self._pending_op, None
+        if op is None or self._response_received[op]:
+            return
+        self._response_received[op] = True
+
+        timeout_signal = self._timeout_signals.get(op)
+        if timeout_signal is None:
+            msg = "Stop response not received => forcibly cleanup => disconnect_timeout."
+            logger.warning(msg)
+            self.disconnect_failure.emit(msg)
             self._cleanup()
-            self._disconnect_response_received = True
+            return
+
+        logger.warning("%s response not received => %s_timeout.", op.capitalize(), op)
+        timeout_signal.emit()
 
     # --------------------------------------------------------------------------
     # RESPONSES
     # --------------------------------------------------------------------------
     def _on_sync_response(self, rsp: SyncResponseData) -> None:
         """Handle sync response from drone."""
-        self._sync_response_received = True
+        self._response_received["sync"] = True
 
         if not rsp.success:
             logger.warning("Sync success=False => Undefined behavior")
@@ -638,7 +842,7 @@ class CommunicationBridge(QObject):
 
     def _on_config_response(self, rsp: ConfigResponseData) -> None:
         """Handle config response from drone."""
-        self._config_response_received = True
+        self._response_received["config"] = True
 
         if not rsp.success:
             logger.warning("Config success=False => Undefined behavior")
@@ -651,7 +855,7 @@ class CommunicationBridge(QObject):
 
     def _on_start_response(self, rsp: StartResponseData) -> None:
         """Handle start response from drone."""
-        self._start_response_received = True
+        self._response_received["start"] = True
 
         if not rsp.success:
             logger.warning("Start success=False => Improper state.")
@@ -666,7 +870,7 @@ class CommunicationBridge(QObject):
 
     def _on_stop_response(self, rsp: StopResponseData) -> None:
         """Handle stop response from drone."""
-        self._stop_response_received = True
+        self._response_received["stop"] = True
 
         if not rsp.success:
             logger.warning("Stop success=False => Improper state.")
@@ -681,7 +885,7 @@ class CommunicationBridge(QObject):
 
     def _on_disconnect_response(self, rsp: StopResponseData) -> None:
         """Handle disconnect response from drone."""
-        self._disconnect_response_received = True
+        self._response_received["disconnect"] = True
 
         if not rsp.success:
             logger.warning("Disconnect success=False => Improper state.")
@@ -714,16 +918,36 @@ class CommunicationBridge(QObject):
         self.disconnect_success.emit("Disconnected")
 
     def _transform_coords(self, easting: float, northing: float, epsg_code: int) -> tuple[float, float]:
-        epsg_str = str(epsg_code)
-        zone = epsg_str[-2:]
-        hemisphere = "north" if epsg_str[-3] == "6" else "south"
-
-        utm_proj = pyproj.Proj(proj="utm", zone=zone, ellps="WGS84", hemisphere=hemisphere)
-        wgs84_proj = pyproj.Proj("epsg:4326")
-        transformer = pyproj.Transformer.from_proj(utm_proj, wgs84_proj, always_xy=True)
-        lng, lat = transformer.transform(easting, northing)
+        if epsg_code == WGS84_EPSG:  # Already lng/lat
+            return (northing, easting)
+        lng, lat = _get_transformer(epsg_code).transform(easting, northing)
         return (lat, lng)
 
+    def _transform_coords_batch(
+        self,
+        eastings: np.ndarray,
+        northings: np.ndarray,
+        epsg_code: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Transform float64 coordinate arrays and return them as (lats, lngs).
+
+        Large batches go to the GPU when cuProj is installed; otherwise, or if the device transform
+        fails, pyproj transforms in place.
+        """
+        if epsg_code == WGS84_EPSG:  # Already lng/lat
+            return (northings, eastings)
+
+        if cuproj is not None and len(eastings) >= GPU_TRANSFORM_MIN_POINTS:
+            try:
+                # cuProj follows the EPSG:4326 authority axis order, i.e. (lat, lng)
+                lats, lngs = _get_gpu_transformer(epsg_code).transform(cp.asarray(eastings), cp.asarray(northings))
+                return (lats.get(), lngs.get())
+            except Exception:
+                logger.exception("GPU coordinate transform failed, falling back to pyproj")
+
+        lngs, lats = _get_transformer(epsg_code).transform(eastings, northings, inplace=True)
+        return (lats, lngs)
+
     # Add logging method to match TypeScript interface
     @pyqtSlot(str)
     def log_message(self, message: str) -> None:
@@ -745,12 +969,13 @@ class CommunicationBridge(QObject):
         """
         try:
             # Create radio config for simulator (server mode)
+            interface_type, port, baudrate, host, tcp_port = _RADIO_KEYS(config)
             radio_cfg = RadioConfig(
-                interface_type=config["interface_type"],
-                port=config["port"],
-                baudrate=int(config["baudrate"]),
-                host=config["host"],
-                tcp_port=int(config["tcp_port"]),
+                interface_type=interface_type,
+                port=port,
+                baudrate=int(baudrate),
+                host=host,
+                tcp_port=int(tcp_port),
                 server_mode=True,  # Simulator acts as server
             )
 
@@ -48,6 +48,8 @@ class DroneCommsService:
         self.radio_config = radio_config
         self.ack_timeout = ack_timeout
         self.max_retries = max_retries
+        # Total time to wait for a response across all retries
+        self.timeout_ms = int(ack_timeout * max_retries * 1000)
         self._comms = DroneComms(
             radio_config=radio_config,
             ack_timeout=ack_timeout,
@@ -41,6 +41,15 @@ class DroneState(Enum):
     ERROR = auto()
 
 
+# Map waiting states to timeout states
+_TIMEOUT_STATES = {
+    DroneState.RADIO_CONFIG_WAITING: DroneState.RADIO_CONFIG_TIMEOUT,
+    DroneState.PING_FINDER_CONFIG_WAITING: DroneState.PING_FINDER_CONFIG_TIMEOUT,
+    DroneState.START_WAITING: DroneState.START_TIMEOUT,
+    DroneState.STOP_WAITING: DroneState.STOP_TIMEOUT,
+}
+
+
 @dataclass
 class StateTransition:
     """Data class for state transition information."""
@@ -105,20 +114,14 @@ class DroneStateMachine(QObject):
     def handle_timeout(self) -> None:
         """Handle timeout in the current state."""
         current_state = self._current_state
+        timeout_state = _TIMEOUT_STATES.get(current_state)
 
-        # Map waiting states to timeout states
-        timeout_map = {
-            DroneState.RADIO_CONFIG_WAITING: DroneState.RADIO_CONFIG_TIMEOUT,
-            DroneState.PING_FINDER_CONFIG_WAITING: DroneState.PING_FINDER_CONFIG_TIMEOUT,
-            DroneState.START_WAITING: DroneState.START_TIMEOUT,
-            DroneState.STOP_WAITING: DroneState.STOP_TIMEOUT,
-        }
-
-        if current_state in timeout_map:
-            self.transition_to(timeout_map[current_state])
-            if current_state in self._timeout_handlers:
+        if timeout_state is not None:
+            self.transition_to(timeout_state)
+            handler = self._timeout_handlers.get(current_state)
+            if handler is not None:
                 try:
-                    self._timeout_handlers[current_state]()
+                    handler()
                 except Exception:
                     logger.exception("Error in timeout handler")
 
@@ -142,9 +145,10 @@ class DroneStateMachine(QObject):
         self._current_state = new_state
         logger.info("State transition: %s -> %s", old_state, new_state)
 
-        if new_state in self._transition_handlers:
+        handler = self._transition_handlers.get(new_state)
+        if handler is not None:
             try:
-                self._transition_handlers[new_state]()
+                handler()
             except Exception as e:
                 error_msg = f"Error in transition handler: {e}"
                 logger.exception(error_msg)
@@ -159,9 +163,10 @@ class DroneStateMachine(QObject):
         Args:
             error_msg: The error message
         """
-        if self._current_state in self._error_handlers:
+        handler = self._error_handlers.get(self._current_state)
+        if handler is not None:
             try:
-                self._error_handlers[self._current_state](error_msg)
+                handler(error_msg)
             except Exception:
                 logger.exception("Error in error handler")
 
@@ -24,10 +24,13 @@ class DroneDataManager(QObject):
         """Initialize drone data manager with empty GPS, ping, and location estimate storage."""
         super().__init__()
         self._frequency_data: dict[int, dict[str, Any]] = {}
+        # Bound once: PyQt6 wraps dict/list payloads in QVariant itself
+        self._emit_gps_signal = self.gps_data_updated.emit
+        self._emit_frequency_signal = self.frequency_data_updated.emit
 
     def update_gps(self, gps: GpsData) -> None:
         """Update current GPS data and emit update signal with the new data."""
-        self.gps_data_updated.emit(QVariant(asdict(gps)))
+        self._emit_gps_signal(asdict(gps))
 
     def _emit_frequency_data(self) -> None:
         """Helper to emit frequency data in a consistent format."""
@@ -38,28 +41,51 @@ class DroneDataManager(QObject):
                 "locationEstimate": freq_data["locationEstimate"],
                 "frequency": freq,
             }
-        self.frequency_data_updated.emit(QVariant(data))
+        self._emit_frequency_signal(data)
 
-    def add_ping(self, ping: PingData) -> None:
-        """Add a new ping detection and emit update signal."""
+    def _append_ping(self, ping: PingData) -> int:
+        """Store a ping under its frequency and return the frequency's ping count.
+
+        The ping's frontend dict is built once here and kept, so later emits reuse it.
+        """
         freq = ping.frequency
         if freq not in self._frequency_data:
             self._frequency_data[freq] = {"pings": [], "locationEstimate": None, "frequency": freq}
 
-        ping_dict = asdict(ping)
-        self._frequency_data[freq]["pings"].append(ping_dict)
-        logger.info("Added ping to frequency %d Hz, total pings: %d", freq, len(self._frequency_data[freq]["pings"]))
+        pings = self._frequency_data[freq]["pings"]
+        pings.append(asdict(ping))
+        return len(pings)
+
+    def add_ping(self, ping: PingData) -> None:
+        """Add a new ping detection and emit update signal."""
+        total = self._append_ping(ping)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Added ping to frequency %d Hz, total pings: %d", ping.frequency, total)
         self._emit_frequency_data()
 
-    def update_loc_est(self, loc_est: LocEstData) -> None:
-        """Update location estimate for a frequency."""
+    def _set_loc_est(self, loc_est: LocEstData) -> None:
+        """Store the location estimate for its frequency."""
         freq = loc_est.frequency
         if freq not in self._frequency_data:
             self._frequency_data[freq] = {"pings": [], "locationEstimate": None, "frequency": freq}
 
-        loc_est_dict = asdict(loc_est)
-        self._frequency_data[freq]["locationEstimate"] = loc_est_dict
-        logger.info("Updated location estimate for frequency %d Hz", freq)
+        self._frequency_data[freq]["locationEstimate"] = asdict(loc_est)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Updated location estimate for frequency %d Hz", freq)
+
+    def update_loc_est(self, loc_est: LocEstData) -> None:
+        """Update location estimate for a frequency."""
+        self._set_loc_est(loc_est)
+        self._emit_frequency_data()
+
+    def apply_batch(self, pings: list[PingData], loc_ests: list[LocEstData]) -> None:
+        """Add pings and update location estimates together, emitting a single update."""
+        for ping in pings:
+            self._append_ping(ping)
+        for loc_est in loc_ests:
+            self._set_loc_est(loc_est)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Applied %d pings and %d location estimates", len(pings), len(loc_ests))
         self._emit_frequency_data()
 
     def clear_frequency_data(self, frequency: int) -> None:
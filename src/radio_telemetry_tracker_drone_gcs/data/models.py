@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class GpsData:
     """GPS position data from the drone including latitude, longitude, altitude, and heading."""
     lat: float
@@ -14,7 +14,7 @@ class GpsData:
     packet_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class PingData:
     """Radio ping detection data including frequency, amplitude, and location."""
     frequency: int
@@ -25,7 +25,7 @@ class PingData:
     packet_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LocEstData:
     """Location estimate data for a specific frequency based on ping detections."""
     frequency: int
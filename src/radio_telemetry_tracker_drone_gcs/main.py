@@ -3,6 +3,7 @@
 import logging
 import sys
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication
 
 from radio_telemetry_tracker_drone_gcs.comms.communication_bridge import CommunicationBridge
@@ -11,23 +12,35 @@ from radio_telemetry_tracker_drone_gcs.window import MainWindow
 
 logger = logging.getLogger(__name__)
 
-def main() -> int:
-    """Start the RTT Drone GCS application."""
+
+def _finish_startup(app: QApplication, window: MainWindow) -> None:
+    """Initialize the DB and bridge once the event loop is running, then load the frontend."""
     try:
         # Initialize DB (tiles + POIs)
         init_db()
 
-        app = QApplication(sys.argv)
-        window = MainWindow()
-
         # Create bridging object
         bridge = CommunicationBridge()
         window.set_bridge(bridge)
 
+        window.load_frontend()
+    except Exception:
+        logger.exception("Failed to initialize application")
+        app.exit(1)
+
+
+def main() -> int:
+    """Start the RTT Drone GCS application."""
+    try:
+        app = QApplication(sys.argv)
+        window = MainWindow()
         window.show()
+
+        # Show the window first; the rest of startup runs on the first event loop pass
+        QTimer.singleShot(0, lambda: _finish_startup(app, window))
         return app.exec()
     except Exception:
-        logger.exception("Failed to initialize DB")
+        logger.exception("Failed to start application")
         return 1
 
 
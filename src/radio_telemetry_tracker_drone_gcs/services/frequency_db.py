@@ -1,8 +1,10 @@
 """Database utilities for managing tracking sessions and frequency data."""
 
+import atexit
 import logging
 import sqlite3
-from collections.abc import Generator
+import threading
+from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 
 from radio_telemetry_tracker_drone_gcs.utils.paths import get_db_path
@@ -11,121 +13,345 @@ logger = logging.getLogger(__name__)
 
 DB_PATH = get_db_path()
 
+# How long a statement waits on another connection's lock before raising "database is locked"
+BUSY_TIMEOUT_S = 30
+
+# One long-lived connection per thread, tracked so they can all be closed at exit. Each connection
+# has its own lock, held for every use, so the group-commit timer never touches one mid-statement
+_local = threading.local()
+_connections: dict[sqlite3.Connection, threading.RLock] = {}
+_connections_lock = threading.Lock()
+
+# Per-connection settings, applied in one script; WAL is persistent and is set once in init_db
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-2000;
+    PRAGMA mmap_size=268435456;
+    PRAGMA wal_autocheckpoint=1000;
+"""
+
+
+def _create_connection() -> sqlite3.Connection:
+    """Open a new autocommit connection and apply the per-connection settings once."""
+    conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT_S, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_CONNECTION_PRAGMAS)
+    with _connections_lock:
+        _connections[conn] = threading.RLock()
+    return conn
+
+
 @contextmanager
 def get_db_connection() -> Generator[sqlite3.Connection]:
-    """Get a database connection with optimized settings."""
-    conn = None
+    """Get this thread's database connection, opening it on first use.
+
+    The connection stays open for reuse and runs in autocommit mode; callers that need
+    several statements in one transaction issue BEGIN/COMMIT themselves. The connection's
+    lock is held until the block exits.
+    """
     try:
-        conn = sqlite3.connect(DB_PATH, timeout=20)
-        # Optimize connection
-        conn.execute("PRAGMA synchronous=NORMAL")  # Faster than FULL, still safe
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA cache_size=-2000")  # Use 2MB of cache
-        yield conn
+        conn = getattr(_local, "conn", None)
+        if conn is None:
+            conn = _local.conn = _create_connection()
+        with _connections[conn]:
+            yield conn
     except sqlite3.Error:
         logger.exception("Database error")
         raise
-    finally:
-        if conn:
+
+
+# Single-row inserts share one transaction until either limit is reached
+GROUP_COMMIT_MAX_ROWS = 500
+GROUP_COMMIT_INTERVAL_S = 0.1
+
+
+class _GroupCommit:
+    """Groups single-row inserts into shared transactions, committed by row count or age."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[sqlite3.Connection, int] = {}
+        self._timer: threading.Timer | None = None
+
+    def execute(self, conn: sqlite3.Connection, sql: str, params: tuple) -> sqlite3.Cursor:
+        """Run a write inside the connection's open group transaction, starting one if needed.
+
+        The caller must hold the connection's lock. If the write fails, a transaction it
+        opened is rolled back so the next call starts clean.
+        """
+        started = not conn.in_transaction
+        if started:
+            conn.execute("BEGIN")
+        try:
+            cursor = conn.execute(sql, params)
+        except sqlite3.Error:
+            if started:
+                conn.execute("ROLLBACK")
+            raise
+
+        with self._lock:
+            rows = self._pending.get(conn, 0) + 1
+            commit_now = rows >= GROUP_COMMIT_MAX_ROWS
+            if commit_now:
+                self._pending.pop(conn, None)
+            else:
+                self._pending[conn] = rows
+                if self._timer is None:
+                    self._timer = threading.Timer(GROUP_COMMIT_INTERVAL_S, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if commit_now:
+            conn.commit()
+        return cursor
+
+    def flush(self) -> None:
+        """Commit every open group transaction, taking each connection's lock in turn."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._pending = self._pending, {}
+
+        for conn in pending:
+            with _connections_lock:
+                conn_lock = _connections.get(conn)
+            if conn_lock is None:
+                continue
+            with conn_lock:
+                try:
+                    if conn.in_transaction:
+                        conn.commit()
+                except sqlite3.Error:
+                    logger.exception("Error committing grouped frequency data")
+
+
+_group_commit = _GroupCommit()
+
+
+def flush() -> None:
+    """Commit frequency rows added by add_frequency_by_session_name that are still waiting for a group commit."""
+    _group_commit.flush()
+
+
+def _close_connections() -> None:
+    """Commit pending grouped inserts, then close every pooled connection."""
+    flush()
+    with _connections_lock:
+        connections = list(_connections.items())
+        _connections.clear()
+    for conn, conn_lock in connections:
+        with conn_lock:
             conn.close()
 
+
+atexit.register(_close_connections)
+
+def _migrate_to_v1(conn: sqlite3.Connection) -> None:
+    """Create the tables and indexes; IF NOT EXISTS also adopts databases created before versioning."""
+    # Create tracking_sessions table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS tracking_sessions (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            date TIMESTAMP NOT NULL
+        )
+    """)
+
+    # Create frequency_data table
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS frequency_data (
+            id INTEGER PRIMARY KEY,
+            session_id INTEGER,
+            frequency INTEGER NOT NULL,
+            data_type TEXT NOT NULL,
+            latitude REAL NOT NULL,
+            longitude REAL NOT NULL,
+            amplitude REAL,
+            timestamp INTEGER NOT NULL,
+            FOREIGN KEY (session_id) REFERENCES tracking_sessions(id)
+        )
+    """)
+
+    # Covering index: per-session reads come from the index alone, already in timestamp order
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_freq_session
+        ON frequency_data(session_id, timestamp, frequency, data_type, latitude, longitude, amplitude)
+    """)
+
+    # Session names are how sessions are looked up, so keep them unique
+    try:
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_name_unique ON tracking_sessions(name)")
+    except sqlite3.IntegrityError:
+        logger.warning("Duplicate tracking session names exist; session names will not be unique")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_name ON tracking_sessions(name)")
+
+# Schema migrations in order; entry N upgrades the frequency tables from version N to N + 1
+_MIGRATIONS = (_migrate_to_v1,)
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+def _get_schema_version(conn: sqlite3.Connection) -> int:
+    """Return the version of the frequency tables, recorded in their own table.
+
+    The database file is shared with the tile and POI tables, so PRAGMA user_version is
+    left for a file-wide version rather than claimed here.
+    """
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS frequency_schema_version (
+            version INTEGER PRIMARY KEY
+        )
+    """)
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM frequency_schema_version").fetchone()[0]
+
 def init_db() -> None:
-    """Initialize the database with tables for tracking sessions and frequency data."""
+    """Initialize the database, migrating its schema up to SCHEMA_VERSION."""
+    # Close any open group transaction so each migration gets its own
+    flush()
+
     try:
         with get_db_connection() as conn:
-            # Enable WAL mode for better concurrent access
-            conn.execute("PRAGMA journal_mode=WAL")
-
-            # Drop existing tables if they exist
-            conn.execute("DROP TABLE IF EXISTS tracking_sessions")
-            conn.execute("DROP TABLE IF EXISTS frequency_data")
-
-            # Create tracking_sessions table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS tracking_sessions (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT NOT NULL,
-                    date TIMESTAMP NOT NULL
-                )
-            """)
+            # Enable WAL mode for better concurrent access; it persists in the file, so only switch once
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode != "wal":
+                journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if journal_mode != "wal":
+                    logger.warning("Could not enable WAL journal mode, database is using '%s'", journal_mode)
 
-            # Create frequency_data table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS frequency_data (
-                    id INTEGER PRIMARY KEY,
-                    session_id INTEGER,
-                    frequency INTEGER NOT NULL,
-                    data_type TEXT NOT NULL,
-                    latitude REAL NOT NULL,
-                    longitude REAL NOT NULL,
-                    amplitude REAL,
-                    timestamp INTEGER NOT NULL,
-                    FOREIGN KEY (session_id) REFERENCES tracking_sessions(id)
-                )
-            """)
+            version = _get_schema_version(conn)
+            if version > SCHEMA_VERSION:
+                logger.warning("Frequency schema version %d is newer than supported %d", version, SCHEMA_VERSION)
 
-            conn.commit()
+            for target in range(version + 1, SCHEMA_VERSION + 1):
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    _MIGRATIONS[target - 1](conn)
+                    conn.execute("INSERT INTO frequency_schema_version (version) VALUES (?)", (target,))
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+                logger.info("Migrated frequency database to schema version %d", target)
+
+            # Refresh planner statistics only where they are stale
+            conn.execute("PRAGMA optimize")
     except sqlite3.Error:
         logger.exception("Error initializing database")
         raise
 
+INSERT_SESSION_SQL = """
+    INSERT INTO tracking_sessions (name, date)
+    VALUES (?, ?)
+"""
+
 def add_tracking_session(name: str, date: str) -> int:
     """Add a new tracking session to the database and return the session's ID."""
     try:
         with get_db_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO tracking_sessions (name, date)
-                VALUES (?, ?)
-            """, (name, date))
-            conn.commit()
+            cursor = conn.execute(INSERT_SESSION_SQL, (name, date))
             return cursor.lastrowid
     except sqlite3.Error:
         logger.exception("Error adding tracking session")
         return -1
 
-def add_frequency(# noqa: PLR0913
+# Shared insert statements; each pooled connection parses them once and reuses them from its statement cache
+INSERT_FREQ_SQL = """
+    INSERT INTO frequency_data (session_id, frequency, data_type, latitude, longitude, amplitude, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_FREQ_BY_SESSION_NAME_SQL = """
+    INSERT INTO frequency_data (session_id, frequency, data_type, latitude, longitude, amplitude, timestamp)
+    SELECT id, ?, ?, ?, ?, ?, ? FROM tracking_sessions WHERE name = ? LIMIT 1
+"""
+
+def add_frequency_by_session_name(# noqa: PLR0913
+    session_name: str,
     frequency: int,
     data_type: str,
     latitude: float,
     longitude: float,
     amplitude: float,
-    session_id: int,
     timestamp: int,
 ) -> bool:
-    """Add a frequency record to the database associated with the given session ID."""
+    """Add a frequency record to the tracking session with the given name.
+
+    The session id is resolved inside the INSERT, so this is a single statement. The row is
+    group-committed within GROUP_COMMIT_INTERVAL_S; call flush() when it must be durable now.
+    """
     try:
         with get_db_connection() as conn:
-            conn.execute("""
-                INSERT INTO frequency_data (session_id, frequency, data_type, latitude, longitude, amplitude, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (session_id, frequency, data_type, latitude, longitude, amplitude, timestamp))
-            conn.commit()
+            cursor = _group_commit.execute(
+                conn,
+                INSERT_FREQ_BY_SESSION_NAME_SQL,
+                (frequency, data_type, latitude, longitude, amplitude, timestamp, session_name),
+            )
+            if cursor.rowcount == 0:
+                logger.error("Session '%s' not found.", session_name)
+                return False
             return True
     except sqlite3.Error:
         logger.exception("Error adding frequency data")
         return False
 
+def _frequency_values(frequencies: list[dict]) -> list[tuple]:
+    """Return the INSERT_FREQ_SQL parameters after session_id for each frequency record."""
+    return [
+        (
+            freq["frequency"],
+            freq["data_type"],
+            freq["latitude"],
+            freq["longitude"],
+            freq["amplitude"],
+            freq["timestamp"],
+        )
+        for freq in frequencies
+    ]
+
+def add_frequencies_bulk(session_id: int, frequencies: list[dict]) -> bool:
+    """Insert many frequency records for one session in a single write transaction."""
+    # Build the rows first so the write lock is held only for the insert itself
+    values = _frequency_values(frequencies)
+
+    # Close any open group transaction so this insert gets its own
+    flush()
+
+    try:
+        with get_db_connection() as conn:
+            # Take the write lock up front rather than upgrading mid-transaction
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(INSERT_FREQ_SQL, ((session_id, *row) for row in values))
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return True
+    except sqlite3.Error:
+        logger.exception("Error adding frequency data in bulk")
+        return False
+
 def save_frequencies_to_session(session_name: str, session_date: str, frequencies: list[dict]) -> int:
-    """Create a new tracking session and save the frequencies associated with it."""
-    session_id = add_tracking_session(session_name, session_date)
-    if session_id == -1:
-        return -1
+    """Create a new tracking session and save the frequencies associated with it.
 
-    for freq in frequencies:
-        success = add_frequency(
-            frequency=freq["frequency"],
-            data_type=freq["data_type"],
-            latitude=freq["latitude"],
-            longitude=freq["longitude"],
-            amplitude=freq["amplitude"],
-            session_id=session_id,
-            timestamp=freq["timestamp"],
-        )
-        if not success:
-            logger.error("Failed to add frequency data for session %s", session_name)
-            return -1
+    The session and its rows are written in one transaction, so a failed save leaves
+    nothing behind and the name can be used again.
+    """
+    values = _frequency_values(frequencies)
+    flush()
 
-    return session_id
+    try:
+        with get_db_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                session_id = conn.execute(INSERT_SESSION_SQL, (session_name, session_date)).lastrowid
+                conn.executemany(INSERT_FREQ_SQL, ((session_id, *row) for row in values))
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return session_id
+    except sqlite3.Error:
+        logger.exception("Error saving frequency data for session %s", session_name)
+        return -1
 
 def get_session_id_by_name(session_name: str) -> int:
     """Retrieve the session ID based on the tracking session name."""
@@ -143,34 +369,36 @@ def get_session_id_by_name(session_name: str) -> int:
         logger.exception("Error retrieving session ID by name")
         return -1
 
-def get_frequencies_by_session(session_name: str) -> list[dict]:
-    """Retrieve all frequency data associated with a specific tracking session."""
+# Column order of the rows yielded by get_frequencies_by_session
+FREQUENCY_FIELDS = ("frequency", "data_type", "latitude", "longitude", "amplitude", "timestamp")
+
+# Rows fetched per fetchmany() call while streaming a session
+FETCH_BATCH_SIZE = 1000
+
+def get_frequencies_by_session(session_name: str) -> Iterator[tuple]:
+    """Yield the frequency data associated with a specific tracking session.
+
+    Rows are plain tuples in FREQUENCY_FIELDS order, read FETCH_BATCH_SIZE at a time so memory stays
+    bounded; callers that need dicts build them at the boundary.
+    """
     session_id = get_session_id_by_name(session_name)
     if session_id == -1:
-        return []
+        return
 
     try:
         with get_db_connection() as conn:
-            cursor = conn.execute("""
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute("""
                 SELECT frequency, data_type, latitude, longitude, amplitude, timestamp
                 FROM frequency_data WHERE session_id = ?
+                ORDER BY timestamp
             """, (session_id,))
-            frequencies = cursor.fetchall()
-
-            return [
-                {
-                    "frequency": freq[0],
-                    "data_type": freq[1],
-                    "latitude": freq[2],
-                    "longitude": freq[3],
-                    "amplitude": freq[4],
-                    "timestamp": freq[5],
-                }
-                for freq in frequencies
-            ]
+            while batch := cursor.fetchmany():
+                yield from batch
     except sqlite3.Error:
         logger.exception("Error retrieving frequency data for session")
-        return []
 
 def get_all_session_names() -> list[str]:
     """Retrieve all session names from the tracking_sessions table."""
@@ -4,11 +4,11 @@ import logging
 from typing import Any
 
 from radio_telemetry_tracker_drone_gcs.services.frequency_db import (
-    add_frequency,
+    FREQUENCY_FIELDS,
+    add_frequency_by_session_name,
     add_tracking_session,
     get_all_session_names,
     get_frequencies_by_session,
-    get_session_id_by_name,
     init_db,
     save_frequencies_to_session,
 )
@@ -42,13 +42,10 @@ class FrequencyService:
         timestamp: int,
     ) -> bool:
         """Add a frequency record to a specific tracking session."""
-        session_id = get_session_id_by_name(session_name)
-        if session_id == -1:
-            logger.error("Session '%s' not found.", session_name)
-            return False
-
         try:
-            return add_frequency(frequency, data_type, latitude, longitude, amplitude, session_id, timestamp)
+            return add_frequency_by_session_name(
+                session_name, frequency, data_type, latitude, longitude, amplitude, timestamp,
+            )
         except Exception:
             logger.exception("Error adding frequency")
             return False
@@ -64,7 +61,7 @@ class FrequencyService:
     def get_frequencies_by_session(self, session_name: str) -> list[dict[str, Any]]:
         """Retrieve all frequency records for a specific tracking session."""
         try:
-            return get_frequencies_by_session(session_name)
+            return [dict(zip(FREQUENCY_FIELDS, row, strict=True)) for row in get_frequencies_by_session(session_name)]
         except Exception:
             logger.exception("Error retrieving frequencies for session")
             return []
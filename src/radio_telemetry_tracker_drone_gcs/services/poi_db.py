@@ -22,16 +22,20 @@ MAX_LATITUDE = 90
 MIN_LONGITUDE = -180
 MAX_LONGITUDE = 180
 
+# Connection tuning, run as a single script on open
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-2000;
+"""
+
 @contextmanager
 def get_db_connection() -> Generator[sqlite3.Connection]:
     """Get a database connection with optimized settings."""
     conn = None
     try:
         conn = sqlite3.connect(DB_PATH, timeout=20)
-        # Optimize connection
-        conn.execute("PRAGMA synchronous=NORMAL")  # Faster than FULL, still safe
-        conn.execute("PRAGMA temp_store=MEMORY")
-        conn.execute("PRAGMA cache_size=-2000")  # Use 2MB of cache
+        conn.executescript(_CONNECTION_PRAGMAS)
         yield conn
     except sqlite3.Error:
         logger.exception("Database error")
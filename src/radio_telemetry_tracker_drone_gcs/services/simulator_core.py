@@ -66,10 +66,8 @@ class GpsDataGenerator:
         self.zone: str = "11S"
         self.hemisphere: str = "north"
 
-        # Create UTM and WGS84 transformers
-        self.utm_proj = pyproj.Proj(proj="utm", zone=11, ellps="WGS84", hemisphere="north")
-        self.wgs84_proj = pyproj.Proj("epsg:4326")
-        self.transformer = pyproj.Transformer.from_proj(self.utm_proj, self.wgs84_proj, always_xy=True)
+        # UTM zone 11N -> WGS84 transformer
+        self.transformer = pyproj.Transformer.from_crs(32611, 4326, always_xy=True)
 
         # Starting position (UTM coordinates)
         self.start_point = WayPoint(489276.681, 3611282.577, 2.0)
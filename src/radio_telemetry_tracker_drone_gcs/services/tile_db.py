@@ -24,14 +24,18 @@ MAX_CONNECTIONS = 5
 _connection_pool: Queue[sqlite3.Connection] = Queue(maxsize=MAX_CONNECTIONS)
 _pool_lock = Lock()
 
+# Applied once when a pooled connection is created; journal_mode is set in init_db
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-2000;
+"""
+
 
 def _create_connection() -> sqlite3.Connection:
     """Create a new optimized database connection."""
     conn = sqlite3.connect(DB_PATH, timeout=20, check_same_thread=False)
-    conn.execute("PRAGMA synchronous=NORMAL")
-    conn.execute("PRAGMA temp_store=MEMORY")
-    conn.execute("PRAGMA cache_size=-2000")
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_CONNECTION_PRAGMAS)
     return conn
 
 
@@ -57,10 +61,6 @@ def get_db_connection() -> Generator[sqlite3.Connection]:
     conn = None
     try:
         conn = _get_connection()
-        # Set optimized connection settings
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        conn.execute("PRAGMA cache_size=-2000")
         yield conn
     except sqlite3.Error:
         logger.exception("Database error")
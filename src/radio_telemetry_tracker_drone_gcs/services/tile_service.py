@@ -53,14 +53,18 @@ class TileService:
     def __init__(self) -> None:
         """Initialize the tile service by ensuring the database is ready."""
         init_db()  # ensure DB is ready
+        self._tile_info: dict | None = None  # cached until tiles are stored or cleared
 
     def get_tile_info(self) -> dict:
-        """Get tile info from the database."""
-        return get_tile_info_db()
+        """Get tile info, querying the database only when the cache has changed."""
+        if self._tile_info is None:
+            self._tile_info = get_tile_info_db()
+        return self._tile_info
 
     def clear_tile_cache(self) -> bool:
         """Clear the tile cache in the database."""
         rows = clear_tile_cache_db()
+        self._tile_info = None
         return rows >= 0
 
     def get_tile(self, z: int, x: int, y: int, source_id: str, *, offline: bool) -> bytes | None:
@@ -90,6 +94,7 @@ class TileService:
         tile_data = self._fetch_tile(z, x, y, source_id)
         if tile_data:
             store_tile_db(z, x, y, source_id, tile_data)
+            self._tile_info = None
         return tile_data
 
     def _fetch_tile(self, z: int, x: int, y: int, source_id: str) -> bytes | None:
@@ -16,7 +16,7 @@ class MainWindow(QMainWindow):
     """Main application window that hosts the web-based frontend using QWebEngineView."""
 
     def __init__(self) -> None:
-        """Initialize the main window and set up the web view with communication bridge."""
+        """Initialize the main window and set up the web view and web channel."""
         super().__init__()
         self.setWindowTitle("Radio Telemetry Tracker Drone GCS")
 
@@ -52,6 +52,11 @@ class MainWindow(QMainWindow):
 
         self.resize(1280, 720)
 
+    def load_frontend(self) -> None:
+        """Load the bundled frontend.
+
+        Call this after ``set_bridge`` so the backend object exists when the page opens its web channel.
+        """
         dist_path = Path(__file__).parent / "frontend_dist" / "index.html"
         if not dist_path.exists():
             logger.error("Frontend dist not found at %s", dist_path)
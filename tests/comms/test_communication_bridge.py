@@ -4,12 +4,22 @@ This module contains tests for the communication bridge class, which manages the
 and communication with the drone.
 """
 
+from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
+from pyproj import Transformer
 from pytestqt.qtbot import QtBot
 
-from radio_telemetry_tracker_drone_gcs.comms.communication_bridge import CommunicationBridge
+from radio_telemetry_tracker_drone_gcs.comms import communication_bridge as communication_bridge_module
+from radio_telemetry_tracker_drone_gcs.comms.communication_bridge import (
+    CommunicationBridge,
+    _get_gpu_transformer,
+    _get_transformer,
+    _RequestOp,
+)
 
 
 @pytest.fixture
@@ -108,10 +118,270 @@ def test_send_config_request_success(communication_bridge: CommunicationBridge)
     mock_comms_service.send_config_request.assert_called_once()
 
 
+def test_send_config_request_no_service(communication_bridge: CommunicationBridge) -> None:
+    """Test that a config request without a connection reports that, before the config is parsed."""
+    communication_bridge.set_comms_service(None)
+    with patch.object(communication_bridge, "config_failure") as mock_signal:
+        assert communication_bridge.send_config_request({}) is False  # noqa: S101
+        mock_signal.emit.assert_called_once_with("UNDEFINED BEHAVIOR: Not Connected.")
+
+
 def test_send_start_request_no_service(communication_bridge: CommunicationBridge) -> None:
     """Test sending a start request when _comms_service is None."""
     communication_bridge.set_comms_service(None)
     # We can connect a slot to start_failure to confirm it emitted
-    with patch.object(communication_bridge, "start_failure") as mock_signal:
-        communication_bridge.send_start_request()
-        mock_signal.emit.assert_called_once()
+    received = []
+    communication_bridge.start_failure.connect(received.append)
+    communication_bridge.send_start_request()
+    assert received == ["UNDEFINED BEHAVIOR: Not Connected."]  # noqa: S101
+
+
+def test_request_op_rejects_unknown_comms_method() -> None:
+    """Test that a misspelled DroneCommsService method name fails when the request table is built."""
+    with pytest.raises(AttributeError, match="send_confg_request"):
+        _RequestOp(
+            register="register_config_response_handler",
+            unregister="unregister_config_response_handler",
+            send="send_confg_request",
+            on_response=print,
+            failure=MagicMock(),
+        )
+
+
+def test_get_serial_ports_cached(communication_bridge: CommunicationBridge) -> None:
+    """Test that repeated port queries within the cache window scan the OS only once."""
+    port = MagicMock()
+    port.device = "COM4"
+    with patch(
+        "radio_telemetry_tracker_drone_gcs.comms.communication_bridge.list_ports.comports",
+        return_value=[port],
+    ) as mock_comports:
+        assert communication_bridge.get_serial_ports() == ["COM4"]  # noqa: S101
+        assert communication_bridge.get_serial_ports() == ["COM4"]  # noqa: S101
+        mock_comports.assert_called_once()
+
+
+def test_send_start_request_timeout(communication_bridge: CommunicationBridge, qtbot: QtBot) -> None:
+    """Test that an unanswered start request emits start_timeout via the shared timer."""
+    mock_comms_service = MagicMock()
+    mock_comms_service.timeout_ms = 10
+    communication_bridge.set_comms_service(mock_comms_service)
+
+    with qtbot.waitSignal(communication_bridge.start_timeout, timeout=1000):
+        assert communication_bridge.send_start_request() is True  # noqa: S101
+
+
+def test_transform_coords_reuses_transformer(communication_bridge: CommunicationBridge) -> None:
+    """Test that UTM -> WGS84 conversion builds one transformer per EPSG code."""
+    _get_transformer.cache_clear()
+
+    lat, lng = communication_bridge._transform_coords(500000.0, 3640000.0, 32611)  # noqa: SLF001
+    communication_bridge._transform_coords(500100.0, 3640000.0, 32611)  # noqa: SLF001
+
+    assert _get_transformer.cache_info().misses == 1  # noqa: S101
+    assert lat == pytest.approx(32.898187, abs=1e-6)  # noqa: S101
+    assert lng == pytest.approx(-117.0, abs=1e-6)  # noqa: S101
+
+
+def test_gps_flush_emits_latest_fix(communication_bridge: CommunicationBridge, qtbot: QtBot) -> None:
+    """Test that GPS fixes buffered within one flush interval produce a single update with the newest fix."""
+    received = []
+    last_packet_id = 3
+    communication_bridge.gps_data_updated.connect(received.append)
+
+    with qtbot.waitSignal(communication_bridge.gps_data_updated, timeout=1000):
+        for packet_id in range(1, last_packet_id + 1):
+            communication_bridge._handle_gps_data(  # noqa: SLF001
+                SimpleNamespace(
+                    easting=500000.0,
+                    northing=3640000.0,
+                    altitude=10.0,
+                    heading=90.0,
+                    epsg_code=32611,
+                    timestamp=packet_id,
+                    packet_id=packet_id,
+                ),
+            )
+
+    assert len(received) == 1  # noqa: S101
+    assert received[0]["packet_id"] == last_packet_id  # noqa: S101
+
+
+def test_transform_coords_southern_hemisphere(communication_bridge: CommunicationBridge) -> None:
+    """Test that southern-hemisphere UTM zones (EPSG 327xx) map to negative latitudes."""
+    lat, lng = communication_bridge._transform_coords(500000.0, 6250000.0, 32756)  # noqa: SLF001
+
+    assert lat == pytest.approx(-33.890365, abs=1e-6)  # noqa: S101
+    assert lng == pytest.approx(153.0, abs=1e-6)  # noqa: S101
+
+
+def test_transform_coords_wgs84_passthrough(communication_bridge: CommunicationBridge) -> None:
+    """Test that EPSG:4326 input is returned as (lat, lng) without building a transformer."""
+    _get_transformer.cache_clear()
+
+    assert communication_bridge._transform_coords(-117.24, 32.88, 4326) == (32.88, -117.24)  # noqa: S101, SLF001
+    assert _get_transformer.cache_info().misses == 0  # noqa: S101
+
+
+def test_flush_emits_frequency_data_once(communication_bridge: CommunicationBridge, qtbot: QtBot) -> None:
+    """Test that pings and location estimates buffered together produce a single frequency update."""
+    received = []
+    frequency = 150000
+    communication_bridge.frequency_data_updated.connect(received.append)
+
+    with qtbot.waitSignal(communication_bridge.frequency_data_updated, timeout=1000):
+        communication_bridge._handle_ping_data(  # noqa: SLF001
+            SimpleNamespace(
+                frequency=frequency,
+                amplitude=10.0,
+                easting=500000.0,
+                northing=3640000.0,
+                epsg_code=32611,
+                timestamp=1,
+                packet_id=1,
+            ),
+        )
+        communication_bridge._handle_loc_est_data(  # noqa: SLF001
+            SimpleNamespace(
+                frequency=frequency,
+                easting=500000.0,
+                northing=3640000.0,
+                epsg_code=32611,
+                timestamp=2,
+                packet_id=2,
+            ),
+        )
+
+    assert len(received) == 1  # noqa: S101
+    freq_data = received[0][str(frequency)]
+    assert len(freq_data["pings"]) == 1  # noqa: S101
+    assert freq_data["locationEstimate"]["packet_id"] == 2  # noqa: S101, PLR2004
+
+
+def test_flush_drops_only_invalid_ping(communication_bridge: CommunicationBridge, qtbot: QtBot) -> None:
+    """Test that a ping missing a field is dropped without discarding the rest of its batch."""
+    received = []
+    frequency = 150000
+    good_packet_ids = [1, 3]
+    communication_bridge.frequency_data_updated.connect(received.append)
+
+    with qtbot.waitSignal(communication_bridge.frequency_data_updated, timeout=1000):
+        for packet_id in range(1, 4):
+            ping = SimpleNamespace(
+                frequency=frequency,
+                amplitude=10.0,
+                easting=500000.0,
+                northing=3640000.0,
+                epsg_code=32611,
+                timestamp=packet_id,
+                packet_id=packet_id,
+            )
+            if packet_id not in good_packet_ids:
+                del ping.easting
+            communication_bridge._handle_ping_data(ping)  # noqa: SLF001
+
+    assert len(received) == 1  # noqa: S101
+    pings = received[0][str(frequency)]["pings"]
+    assert [ping["packet_id"] for ping in pings] == good_packet_ids  # noqa: S101
+
+
+def test_transform_pings_interleaved_epsg(communication_bridge: CommunicationBridge) -> None:
+    """Test that pings from interleaved EPSG codes each keep their own coordinates and order."""
+    coords = [
+        (500000.0, 3640000.0, 32611),
+        (500000.0, 6250000.0, 32756),
+        (-117.24, 32.88, 4326),
+        (500100.0, 3640100.0, 32611),
+        (500200.0, 6250200.0, 32756),
+    ]
+    pings = [
+        SimpleNamespace(
+            frequency=150000,
+            amplitude=10.0,
+            easting=easting,
+            northing=northing,
+            epsg_code=epsg_code,
+            timestamp=packet_id,
+            packet_id=packet_id,
+        )
+        for packet_id, (easting, northing, epsg_code) in enumerate(coords)
+    ]
+
+    internal_pings = communication_bridge._transform_pings(pings)  # noqa: SLF001
+
+    assert [ping.packet_id for ping in internal_pings] == list(range(len(coords)))  # noqa: S101
+    for ping, (easting, northing, epsg_code) in zip(internal_pings, coords, strict=True):
+        lat, lng = communication_bridge._transform_coords(easting, northing, epsg_code)  # noqa: SLF001
+        assert ping.lat == pytest.approx(lat, abs=1e-9)  # noqa: S101
+        assert ping.long == pytest.approx(lng, abs=1e-9)  # noqa: S101
+
+
+class _FakeDeviceArray:
+    """Stands in for a cupy array: holds host data and copies it back with get()."""
+
+    def __init__(self, data: np.ndarray) -> None:
+        self._data = data
+
+    def get(self) -> np.ndarray:
+        return self._data
+
+
+class _FakeGpuTransformer:
+    """Mimics cuproj.Transformer: returns arrays in the target CRS authority axis order."""
+
+    def __init__(self, src: str, dst: str) -> None:
+        self._transformer = Transformer.from_crs(src, dst)
+
+    @classmethod
+    def from_crs(cls, src: str, dst: str) -> "_FakeGpuTransformer":
+        return cls(src, dst)
+
+    def transform(self, x: np.ndarray, y: np.ndarray) -> tuple[_FakeDeviceArray, _FakeDeviceArray]:
+        first, second = self._transformer.transform(x, y)
+        return _FakeDeviceArray(np.asarray(first)), _FakeDeviceArray(np.asarray(second))
+
+
+@pytest.fixture
+def fake_gpu(monkeypatch: pytest.MonkeyPatch) -> Generator[None]:
+    """Route every batch transform through a fake cuProj."""
+    monkeypatch.setattr(communication_bridge_module, "cuproj", SimpleNamespace(Transformer=_FakeGpuTransformer))
+    monkeypatch.setattr(communication_bridge_module, "cp", SimpleNamespace(asarray=np.asarray))
+    monkeypatch.setattr(communication_bridge_module, "GPU_TRANSFORM_MIN_POINTS", 1)
+    _get_gpu_transformer.cache_clear()
+    yield
+    _get_gpu_transformer.cache_clear()
+
+
+@pytest.mark.usefixtures("fake_gpu")
+def test_transform_coords_batch_gpu_order(communication_bridge: CommunicationBridge) -> None:
+    """Test that the GPU path returns (lats, lngs) like the pyproj path."""
+    lats, lngs = communication_bridge._transform_coords_batch(  # noqa: SLF001
+        np.array([500000.0]),
+        np.array([3640000.0]),
+        32611,
+    )
+
+    assert lats[0] == pytest.approx(32.898187, abs=1e-6)  # noqa: S101
+    assert lngs[0] == pytest.approx(-117.0, abs=1e-6)  # noqa: S101
+
+
+@pytest.mark.usefixtures("fake_gpu")
+def test_transform_coords_batch_gpu_failure_falls_back(
+    communication_bridge: CommunicationBridge,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a failing device transform falls back to pyproj instead of raising."""
+
+    def fail(*_: object) -> None:
+        msg = "no CUDA device"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(_FakeGpuTransformer, "transform", fail)
+    lats, lngs = communication_bridge._transform_coords_batch(  # noqa: SLF001
+        np.array([500000.0]),
+        np.array([3640000.0]),
+        32611,
+    )
+
+    assert lats[0] == pytest.approx(32.898187, abs=1e-6)  # noqa: S101
+    assert lngs[0] == pytest.approx(-117.0, abs=1e-6)  # noqa: S101
@@ -70,3 +70,8 @@ def test_send_sync_request(drone_comms_service: DroneCommsService) -> None:
     result = drone_comms_service.send_sync_request()
     drone_comms_service.get_comms().send_sync_request.assert_called_once()
     assert result == packet_id  # noqa: S101
+
+
+def test_timeout_ms(drone_comms_service: DroneCommsService) -> None:
+    """Test that the total response timeout is precomputed from ack_timeout and max_retries."""
+    assert drone_comms_service.timeout_ms == 6000  # noqa: S101, PLR2004
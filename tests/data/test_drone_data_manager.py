@@ -3,6 +3,8 @@
 This module contains tests for GPS, ping, and location estimate data management.
 """
 
+from dataclasses import asdict
+
 import pytest
 from pytestqt.qtbot import QtBot
 
@@ -85,3 +87,36 @@ def test_clear_all_frequency_data(data_manager: DroneDataManager) -> None:
 
     data_manager.clear_all_frequency_data()
     assert len(data_manager.get_frequencies()) == 0  # noqa: S101
+
+
+def test_apply_batch_emits_once(data_manager: DroneDataManager, qtbot: QtBot) -> None:  # noqa: ARG001
+    """Test that a batch of pings and location estimates produces a single frequency update."""
+    freq_signal_received = []
+    data_manager.frequency_data_updated.connect(freq_signal_received.append)
+
+    pings = [
+        PingData(frequency=TEST_FREQUENCY, amplitude=10.0, lat=32.88, long=-117.24, timestamp=1, packet_id=1),
+        PingData(frequency=TEST_FREQUENCY, amplitude=9.0, lat=32.89, long=-117.25, timestamp=2, packet_id=2),
+        PingData(frequency=TEST_FREQUENCY_2, amplitude=8.0, lat=32.70, long=-117.20, timestamp=3, packet_id=3),
+    ]
+    loc_est = LocEstData(frequency=TEST_FREQUENCY, lat=32.5, long=-117.0, timestamp=4, packet_id=4)
+    data_manager.apply_batch(pings, [loc_est])
+
+    assert len(freq_signal_received) == 1  # noqa: S101
+    assert len(data_manager.get_frequencies()) == EXPECTED_FREQUENCY_COUNT  # noqa: S101
+    assert freq_signal_received[0][str(TEST_FREQUENCY)]["locationEstimate"] == asdict(loc_est)  # noqa: S101
+
+
+def test_ping_payload_round_trip(data_manager: DroneDataManager, qtbot: QtBot) -> None:  # noqa: ARG001
+    """Test that pings emitted to the frontend keep every field."""
+    freq_signal_received = []
+    data_manager.frequency_data_updated.connect(freq_signal_received.append)
+
+    pings = [
+        PingData(frequency=TEST_FREQUENCY, amplitude=float(i), lat=32.0 + i, long=-117.0, timestamp=i, packet_id=i)
+        for i in range(300)
+    ]
+    data_manager.apply_batch(pings, [])
+
+    emitted = freq_signal_received[-1][str(TEST_FREQUENCY)]["pings"]
+    assert emitted == [asdict(ping) for ping in pings]  # noqa: S101
@@ -0,0 +1 @@
+"""Tests for the RTT Drone GCS build and development scripts."""
@@ -0,0 +1,79 @@
+"""Tests for the frontend build helpers in scripts/utils.py.
+
+npm is replaced by a small script on PATH that records each call and writes dist/ from src/.
+"""
+
+import importlib
+import os
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="the fake npm is a POSIX executable script")
+
+FAKE_NPM = """#!{python}
+import os
+import sys
+from pathlib import Path
+
+with open(os.environ["FAKE_NPM_LOG"], "a", encoding="utf-8") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+
+if sys.argv[1:] == ["run", "build"]:
+    dist = Path("dist")
+    dist.mkdir(exist_ok=True)
+    # Like vite, replace output files rather than writing into them
+    for old in dist.iterdir():
+        old.unlink()
+    (dist / "index.html").write_text(Path("src/main.js").read_text(encoding="utf-8"), encoding="utf-8")
+"""
+
+
+@pytest.fixture
+def npm_log(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Put a fake npm first on PATH and return the file it logs its arguments to."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    npm = bin_dir / "npm"
+    npm.write_text(FAKE_NPM.format(python=sys.executable), encoding="utf-8")
+    npm.chmod(0o755)
+
+    log = tmp_path / "npm.log"
+    log.touch()
+    monkeypatch.setenv("FAKE_NPM_LOG", str(log))
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+@pytest.fixture
+def utils(tmp_path: Path, npm_log: Path, monkeypatch: pytest.MonkeyPatch) -> ModuleType:  # noqa: ARG001
+    """Import scripts.utils against the fake npm, building a frontend under tmp_path."""
+    # npm is resolved at import, so import afresh now that the fake is on PATH
+    monkeypatch.delitem(sys.modules, "scripts.utils", raising=False)
+    module = importlib.import_module("scripts.utils")
+
+    frontend_dir = tmp_path / "frontend"
+    (frontend_dir / "src").mkdir(parents=True)
+    (frontend_dir / "package.json").write_text('{"name": "frontend"}', encoding="utf-8")
+    (frontend_dir / "src" / "main.js").write_text("v1", encoding="utf-8")
+    monkeypatch.setattr(module, "FRONTEND_DIR", frontend_dir)
+    monkeypatch.setattr(module, "PACKAGE_DIST", tmp_path / "package" / "frontend_dist")
+    return module
+
+
+def test_build_frontend_skips_unchanged_and_relinks_on_change(utils: ModuleType, npm_log: Path) -> None:
+    """An unchanged frontend is not rebuilt; a source change rebuilds and relinks without reinstalling."""
+    package_dist = utils.build_frontend()
+    assert npm_log.read_text(encoding="utf-8").splitlines() == ["install", "run build"]  # noqa: S101
+    assert (package_dist / "index.html").read_text(encoding="utf-8") == "v1"  # noqa: S101
+
+    utils.build_frontend()
+    assert npm_log.read_text(encoding="utf-8").splitlines() == ["install", "run build"]  # noqa: S101
+
+    (utils.FRONTEND_DIR / "src" / "main.js").write_text("v2", encoding="utf-8")
+    utils.build_frontend()
+    assert npm_log.read_text(encoding="utf-8").splitlines() == ["install", "run build", "run build"]  # noqa: S101
+    assert (package_dist / "index.html").read_text(encoding="utf-8") == "v2"  # noqa: S101
+    assert (package_dist / "index.html").samefile(utils.FRONTEND_DIR / "dist" / "index.html")  # noqa: S101
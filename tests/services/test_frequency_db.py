@@ -0,0 +1,162 @@
+"""Tests for the frequency database module."""
+
+import sqlite3
+from collections.abc import Generator
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from radio_telemetry_tracker_drone_gcs.services import frequency_db
+
+
+@pytest.fixture
+def temp_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path]:
+    """Point the frequency database at a fresh file with no cached connection."""
+    db_path = tmp_path / "test.db"
+    monkeypatch.setattr(frequency_db, "DB_PATH", db_path)
+    monkeypatch.setattr(frequency_db, "_local", frequency_db.threading.local())
+    monkeypatch.setattr(frequency_db, "_connections", {})
+    frequency_db.init_db()
+    yield db_path
+    frequency_db._close_connections()  # noqa: SLF001
+
+
+def test_connection_reused(temp_db: Path) -> None:  # noqa: ARG001
+    """Consecutive calls on one thread share a single connection."""
+    with frequency_db.get_db_connection() as first, frequency_db.get_db_connection() as second:
+        assert first is second  # noqa: S101
+
+
+def test_save_and_get_frequencies(temp_db: Path) -> None:  # noqa: ARG001
+    """Saved frequency rows are read back for the session."""
+    rows = [
+        {
+            "frequency": 150000000,
+            "data_type": "ping",
+            "latitude": 32.88,
+            "longitude": -117.24,
+            "amplitude": 10.0,
+            "timestamp": i,
+        }
+        for i in range(3)
+    ]
+    session_id = frequency_db.save_frequencies_to_session("session", "2024-01-01", rows)
+    assert session_id > 0  # noqa: S101
+    fields = frequency_db.FREQUENCY_FIELDS
+    saved = [dict(zip(fields, row, strict=True)) for row in frequency_db.get_frequencies_by_session("session")]
+    assert saved == rows  # noqa: S101
+
+
+def test_failed_save_can_be_retried(temp_db: Path) -> None:  # noqa: ARG001
+    """A save that fails on one row leaves no session behind, so the name can be saved again."""
+    row = {
+        "frequency": 150000000,
+        "data_type": "ping",
+        "latitude": 32.88,
+        "longitude": -117.24,
+        "amplitude": 10.0,
+        "timestamp": 1,
+    }
+    assert frequency_db.save_frequencies_to_session("session", "2024-01-01", [{**row, "latitude": None}]) == -1  # noqa: S101
+    assert frequency_db.get_all_session_names() == []  # noqa: S101
+
+    assert frequency_db.save_frequencies_to_session("session", "2024-01-01", [row]) > 0  # noqa: S101
+    assert len(list(frequency_db.get_frequencies_by_session("session"))) == 1  # noqa: S101
+
+
+def test_init_db_keeps_sessions(temp_db: Path) -> None:  # noqa: ARG001
+    """Re-initializing the database does not discard saved sessions."""
+    frequency_db.add_tracking_session("session", "2024-01-01")
+    frequency_db.init_db()
+    assert frequency_db.get_all_session_names() == ["session"]  # noqa: S101
+
+
+def test_add_frequency_by_session_name(temp_db: Path) -> None:  # noqa: ARG001
+    """A frequency is stored under the named session, and unknown sessions are rejected."""
+    frequency_db.add_tracking_session("session", "2024-01-01")
+
+    assert frequency_db.add_frequency_by_session_name("session", 150000000, "ping", 32.88, -117.24, 10.0, 1)  # noqa: S101
+    assert not frequency_db.add_frequency_by_session_name("missing", 150000000, "ping", 32.88, -117.24, 10.0, 2)  # noqa: S101
+    assert len(list(frequency_db.get_frequencies_by_session("session"))) == 1  # noqa: S101
+
+
+def test_add_frequency_group_commit(temp_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Single inserts stay in an open transaction until flushed."""
+    monkeypatch.setattr(frequency_db, "GROUP_COMMIT_INTERVAL_S", 60)
+    frequency_db.add_tracking_session("session", "2024-01-01")
+    frequency_db.add_frequency_by_session_name("session", 150000000, "ping", 32.88, -117.24, 10.0, 1)
+
+    with frequency_db.get_db_connection() as conn:
+        assert conn.in_transaction  # noqa: S101
+        frequency_db.flush()
+        assert not conn.in_transaction  # noqa: S101
+
+    with closing(sqlite3.connect(temp_db)) as other:
+        assert other.execute("SELECT COUNT(*) FROM frequency_data").fetchone()[0] == 1  # noqa: S101
+
+
+def test_add_frequency_failed_insert_rolls_back(temp_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A rejected insert does not leave a transaction open for the next one."""
+    monkeypatch.setattr(frequency_db, "GROUP_COMMIT_INTERVAL_S", 60)
+    frequency_db.add_tracking_session("session", "2024-01-01")
+
+    assert not frequency_db.add_frequency_by_session_name("session", 150000000, "ping", None, -117.24, 10.0, 1)  # noqa: S101
+    assert frequency_db.add_frequency_by_session_name("session", 150000000, "ping", 32.88, -117.24, 10.0, 2)  # noqa: S101
+    frequency_db.flush()
+
+    with closing(sqlite3.connect(temp_db)) as other:
+        assert other.execute("SELECT COUNT(*) FROM frequency_data").fetchone()[0] == 1  # noqa: S101
+
+
+def test_init_db_after_pending_insert(temp_db: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Re-initializing with a group transaction open commits it instead of failing to BEGIN."""
+    monkeypatch.setattr(frequency_db, "GROUP_COMMIT_INTERVAL_S", 60)
+    frequency_db.add_tracking_session("session", "2024-01-01")
+    frequency_db.add_frequency_by_session_name("session", 150000000, "ping", 32.88, -117.24, 10.0, 1)
+
+    with frequency_db.get_db_connection() as conn:
+        conn.execute("DELETE FROM frequency_schema_version")
+    frequency_db.init_db()
+
+    with closing(sqlite3.connect(temp_db)) as other:
+        assert other.execute("SELECT COUNT(*) FROM frequency_data").fetchone()[0] == 1  # noqa: S101
+        version = other.execute("SELECT MAX(version) FROM frequency_schema_version").fetchone()[0]
+        assert version == frequency_db.SCHEMA_VERSION  # noqa: S101
+
+
+def test_init_db_persists_wal(temp_db: Path) -> None:
+    """WAL journal mode is stored in the database file, so new connections see it."""
+    with closing(sqlite3.connect(temp_db)) as other:
+        assert other.execute("PRAGMA journal_mode").fetchone()[0] == "wal"  # noqa: S101
+
+
+def test_connection_busy_timeout(temp_db: Path) -> None:  # noqa: ARG001
+    """Connections wait on locks for BUSY_TIMEOUT_S instead of failing immediately."""
+    with frequency_db.get_db_connection() as conn:
+        busy_timeout_ms = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+    assert busy_timeout_ms == frequency_db.BUSY_TIMEOUT_S * 1000  # noqa: S101
+
+
+def test_close_connections(temp_db: Path) -> None:  # noqa: ARG001
+    """Closing the pool closes every connection opened through it."""
+    with frequency_db.get_db_connection() as conn:
+        pass
+    frequency_db._close_connections()  # noqa: SLF001
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_session_names_unique(temp_db: Path) -> None:  # noqa: ARG001
+    """A second session with an existing name is rejected."""
+    assert frequency_db.add_tracking_session("session", "2024-01-01") > 0  # noqa: S101
+    assert frequency_db.add_tracking_session("session", "2024-01-02") == -1  # noqa: S101
+
+
+def test_init_db_sets_schema_version(temp_db: Path) -> None:
+    """init_db records the schema version in its own table and leaves the file-wide user_version alone."""
+    with closing(sqlite3.connect(temp_db)) as other:
+        version = other.execute("SELECT MAX(version) FROM frequency_schema_version").fetchone()[0]
+        assert version == frequency_db.SCHEMA_VERSION  # noqa: S101
+        assert other.execute("PRAGMA user_version").fetchone()[0] == 0  # noqa: S101
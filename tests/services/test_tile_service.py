@@ -87,3 +87,30 @@ def test_fetch_tile_http_success(tile_service: TileService) -> None:
         mock_get.assert_called_once_with(1, 2, 3, "osm")
         mock_store.assert_called_once_with(1, 2, 3, "osm", b"MOCK_TILE_DATA")
         mock_http.assert_called_once()
+
+
+def test_get_tile_info_cached_until_store(tile_service: TileService) -> None:
+    """Test that tile info is queried once and refreshed after a new tile is stored."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = b"MOCK_TILE_DATA"
+
+    with (
+        patch(
+            "radio_telemetry_tracker_drone_gcs.services.tile_service.get_tile_info_db",
+            return_value={"total_tiles": 0, "total_size_mb": 0},
+        ) as mock_info,
+        patch("radio_telemetry_tracker_drone_gcs.services.tile_service.get_tile_db", return_value=None),
+        patch(
+            "radio_telemetry_tracker_drone_gcs.services.tile_service.requests.get",
+            return_value=mock_response,
+        ),
+        patch("radio_telemetry_tracker_drone_gcs.services.tile_service.store_tile_db", return_value=True),
+    ):
+        tile_service.get_tile_info()
+        tile_service.get_tile_info()
+        assert mock_info.call_count == 1  # noqa: S101
+
+        tile_service.get_tile(1, 2, 3, "osm", offline=False)
+        tile_service.get_tile_info()
+        assert mock_info.call_count == 2  # noqa: S101, PLR2004